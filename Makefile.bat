@@ -23,6 +23,7 @@ if "%1"=="install" goto install
 if "%1"=="reinstall" goto reinstall
 if "%1"=="serve" goto serve
 if "%1"=="build" goto build
+if "%1"=="bench" goto bench
 if "%1"=="help" goto help
 echo Unknown target: %1
 goto help
@@ -86,6 +87,18 @@ if errorlevel 1 (
 )
 goto :eof
 
+:bench
+if not exist %VENV%\.installed call :install
+if errorlevel 1 exit /b 1
+%PYTHON% benchmarks\run_benchmarks.py %~2
+if errorlevel 1 (
+    echo.
+    echo Error: Benchmarks failed or regressed past the baseline.
+    echo   If the change is expected, re-record it: Makefile.bat bench "--update-baseline"
+    exit /b 1
+)
+goto :eof
+
 :help
 echo Please use "Makefile.bat [target]" where [target] is one of:
 echo   install       to create a virtual environment and install all doc dependencies
@@ -94,4 +107,6 @@ echo   serve         to watch, rebuild, and serve the docs locally with live rel
 echo                   pass extra flags as a second arg: Makefile.bat serve "--watch-theme"
 echo   build         to build the static site and validate it compiles cleanly (mirrors CI)
 echo                   pass extra flags as a second arg: Makefile.bat build "-d site"
+echo   bench         to benchmark the hooks offline on a synthetic docs tree and check for regressions
+echo                   pass extra flags as a second arg: Makefile.bat bench "--size large"
 goto :eof
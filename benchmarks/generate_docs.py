@@ -0,0 +1,249 @@
+"""Generate a synthetic docs tree for benchmarking the MkDocs hooks.
+
+The tree looks like the real polkadot-docs content as far as the hooks are
+concerned:
+
+  - nested section directories, each with a ``.nav.yml`` (title, nav list,
+    occasionally ``footer_nav``) and an ``index.md`` holding INDEX TABLE blocks
+  - pages with front matter (title, description, short_description, tools,
+    page_badges, occasionally footer_nav) and paragraphs that mention
+    glossary terms
+  - ``reference/glossary.md`` with the requested number of terms, some with a
+    parenthesized alias
+  - orphan pages under ``extras/`` subdirectories that are excluded from the
+    nav with ``not_in_nav``, which is what synthesize_ancestors handles
+  - an ``mkdocs.yml`` that runs this repository's hooks, so the tree can also
+    be built with ``mkdocs build -f <out>/mkdocs.yml``
+
+Usage:
+
+  python benchmarks/generate_docs.py /tmp/bench-docs --pages 2000 --depth 4
+
+The output is fully determined by the options (including ``--seed``).
+"""
+
+import argparse
+import os
+import random
+import shutil
+
+HOOKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "hooks")
+HOOKS = [
+    "auto_index_table.py",
+    "footer_nav.py",
+    "glossary_abbreviations.py",
+    "synthesize_ancestors.py",
+    "page_dependencies.py",
+]
+
+WORDS = (
+    "account asset block bridge chain client consensus contract deploy encode event fee "
+    "governance index key ledger message module network node pallet parachain proof query "
+    "runtime signer staking storage token transaction transfer upgrade validator wallet"
+).split()
+TOOLS = ["PAPI", "Polkadot.js", "Subxt", "Hardhat", "Foundry", "Chopsticks", "Zombienet"]
+BADGES = ["beginner", "intermediate", "advanced"]
+ORPHAN_DIR = "extras"
+
+INDEX_TABLE_BLOCKS = [
+    "<!-- INDEX TABLE START -->\n<!-- INDEX TABLE END -->",
+    "<!-- INDEX TABLE START\nflat: true\ncolumns: [title, description]\n-->\n<!-- INDEX TABLE END -->",
+    "<!-- INDEX TABLE START\ncolumns: [title, difficulty, tools]\n-->\n<!-- INDEX TABLE END -->",
+]
+
+
+def generate(
+    out_dir,
+    pages=500,
+    depth=3,
+    fanout=4,
+    index_tables=2,
+    glossary=150,
+    orphan_ratio=0.1,
+    seed=1,
+):
+    """Write a docs tree and mkdocs.yml under ``out_dir``; returns a summary dict."""
+    rnd = random.Random(seed)
+    docs_dir = os.path.join(out_dir, "docs")
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+    os.makedirs(docs_dir)
+
+    terms = _glossary_terms(glossary, rnd)
+    _write(os.path.join(docs_dir, "reference", "glossary.md"), _glossary_page(terms, rnd))
+    _write(os.path.join(docs_dir, "reference", ".nav.yml"), "title: Reference\nnav:\n  - glossary.md\n")
+
+    sections = _sections(depth, fanout)
+    orphan_count = int(pages * orphan_ratio)
+    pages_in_nav = max(0, pages - orphan_count)
+
+    per_section = {section: [] for section in sections}
+    for i in range(pages_in_nav):
+        per_section[sections[i % len(sections)]].append(f"page-{i}.md")
+
+    for section in sections:
+        children = [s for s in sections if s and os.path.dirname(s) == section]
+        section_dir = os.path.join(docs_dir, section)
+        _write(
+            os.path.join(section_dir, ".nav.yml"),
+            _nav_yml(section, per_section[section], children, rnd),
+        )
+        _write(
+            os.path.join(section_dir, "index.md"),
+            _index_page(section, index_tables),
+        )
+        for name in per_section[section]:
+            _write(os.path.join(section_dir, name), _page(name, terms, rnd))
+
+    for i in range(orphan_count):
+        section = sections[i % len(sections)]
+        nested = os.path.join(section, ORPHAN_DIR, f"group-{i % 3}")
+        _write(os.path.join(docs_dir, nested, f"orphan-{i}.md"), _page(f"orphan-{i}.md", terms, rnd))
+
+    _write(os.path.join(out_dir, "mkdocs.yml"), _mkdocs_yml())
+    return {
+        "pages": pages_in_nav + orphan_count + len(sections) + 1,
+        "sections": len(sections),
+        "orphans": orphan_count,
+        "glossary_terms": len(terms),
+    }
+
+
+def _sections(depth, fanout):
+    """Relative section dirs, breadth-first: "", "s0", "s1", "s0/s0", ..."""
+    sections = [""]
+    level = [""]
+    for _ in range(depth):
+        level = [os.path.join(parent, f"s{i}") if parent else f"s{i}" for parent in level for i in range(fanout)]
+        sections.extend(level)
+    return sections
+
+
+def _glossary_terms(count, rnd):
+    terms = []
+    seen = set()
+    while len(terms) < count:
+        words = [w.capitalize() for w in rnd.sample(WORDS, rnd.choice((1, 2, 2, 3)))]
+        term = " ".join(words)
+        if term in seen:
+            continue
+        seen.add(term)
+        alias = "".join(w[0] for w in words).upper() if len(words) > 1 and rnd.random() < 0.3 else None
+        terms.append((term, alias))
+    return terms
+
+
+def _glossary_page(terms, rnd):
+    lines = ["---", "title: Glossary", "---", "# Glossary", ""]
+    for term, alias in terms:
+        heading = f"{term} ({alias})" if alias else term
+        lines += [f"## {heading}", "", _sentence(rnd, 12) + ".", ""]
+    return "\n".join(lines)
+
+
+def _nav_yml(section, pages, children, rnd):
+    title = _title(os.path.basename(section)) if section else "Home"
+    lines = [f"title: {title}"]
+    if section and rnd.random() < 0.05:
+        lines.append("footer_nav: true")
+    lines.append("nav:")
+    lines.append("  - index.md")
+    for name in pages:
+        lines.append(f"  - {name}")
+    for child in children:
+        lines.append(f"  - '{_title(os.path.basename(child))}': {os.path.basename(child)}")
+    if not section:
+        lines.append("  - reference")
+    return "\n".join(lines) + "\n"
+
+
+def _index_page(section, index_tables):
+    title = _title(os.path.basename(section)) if section else "Home"
+    blocks = [INDEX_TABLE_BLOCKS[i % len(INDEX_TABLE_BLOCKS)] for i in range(index_tables)]
+    return "\n\n".join([f"---\ntitle: {title}\ndescription: {title} overview.\n---\n# {title}"] + blocks) + "\n"
+
+
+def _page(name, terms, rnd):
+    title = _title(os.path.splitext(name)[0])
+    meta = [
+        "---",
+        f"title: {title}",
+        f"description: {_sentence(rnd, 10)}.",
+    ]
+    if rnd.random() < 0.5:
+        meta.append(f"short_description: {_sentence(rnd, 6)}.")
+    if rnd.random() < 0.6:
+        meta.append(f"tools: {', '.join(rnd.sample(TOOLS, rnd.randint(1, 3)))}")
+    if rnd.random() < 0.3:
+        meta += ["page_badges:", f"  tutorial_badge: {rnd.choice(BADGES)}"]
+    if rnd.random() < 0.01:
+        meta.append(f"footer_nav: {rnd.randint(1, 5)}")
+    meta.append("---")
+
+    body = [f"# {title}", ""]
+    for _ in range(rnd.randint(3, 8)):
+        words = _sentence(rnd, rnd.randint(20, 60)).split()
+        for _ in range(rnd.randint(0, 4)):
+            term, alias = rnd.choice(terms)
+            words.insert(rnd.randrange(len(words)), alias if alias and rnd.random() < 0.5 else term)
+        body += [" ".join(words) + ".", ""]
+    body += ["```python", f"print({rnd.choice(WORDS)!r})", "```", ""]
+    return "\n".join(meta + body)
+
+
+def _sentence(rnd, n):
+    return " ".join(rnd.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def _title(name):
+    return name.replace("-", " ").replace("_", " ").title()
+
+
+def _mkdocs_yml():
+    hooks = "\n".join(f"  - {os.path.join(HOOKS_DIR, name)}" for name in HOOKS)
+    return (
+        "site_name: Hook Benchmark\n"
+        "docs_dir: docs\n"
+        "not_in_nav: |\n"
+        f"  **/{ORPHAN_DIR}/**\n"
+        "hooks:\n"
+        f"{hooks}\n"
+        "extra:\n"
+        "  glossary_tooltips:\n"
+        "    cache: false\n"
+    )
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic docs tree for the hook benchmarks.")
+    parser.add_argument("out_dir", help="Directory to create (replaced if it exists)")
+    parser.add_argument("--pages", type=int, default=500, help="Number of content pages (default: 500)")
+    parser.add_argument("--depth", type=int, default=3, help="Section nesting depth (default: 3)")
+    parser.add_argument("--fanout", type=int, default=4, help="Subsections per section (default: 4)")
+    parser.add_argument("--index-tables", type=int, default=2, help="INDEX TABLE blocks per section index page")
+    parser.add_argument("--glossary", type=int, default=150, help="Number of glossary terms (default: 150)")
+    parser.add_argument("--orphan-ratio", type=float, default=0.1, help="Share of pages outside the nav")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    summary = generate(
+        args.out_dir,
+        pages=args.pages,
+        depth=args.depth,
+        fanout=args.fanout,
+        index_tables=args.index_tables,
+        glossary=args.glossary,
+        orphan_ratio=args.orphan_ratio,
+        seed=args.seed,
+    )
+    print(f"Generated {summary['pages']} pages in {summary['sections']} sections under {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Offline benchmark suite for the MkDocs hooks.
+
+Generates a synthetic docs tree (see generate_docs.py), then calls each hook's
+entry points directly, the way MkDocs would during a build, and measures:
+
+  auto_index_table       on_files, on_page_markdown   (every page)
+  glossary_abbreviations on_page_content              (every page)
+  footer_nav             on_nav
+  synthesize_ancestors   on_nav, on_page_context      (every page)
+
+Each case is run cold (hook modules re-executed and the shared helper state in
+_hook_state/_frontmatter/_nav_graph/_nav_index/_page_deps reset, like a fresh
+``mkdocs build``) and warm (same modules, shared state kept, like a
+``mkdocs serve`` rebuild). The best of ``--repeat`` runs is reported as items
+per second. Peak memory is measured in a separate tracemalloc run, so tracing
+overhead does not distort the timings.
+
+Results are compared with benchmarks/baseline.json, and the run exits with
+status 1 when a case's throughput drops or its peak memory grows by more than
+``--tolerance`` (default 30%; machines differ, so keep the baseline from the
+machine that runs the check, e.g. CI):
+
+  python benchmarks/run_benchmarks.py                     # check medium preset
+  python benchmarks/run_benchmarks.py --size large --json out.json
+  python benchmarks/run_benchmarks.py --update-baseline   # record new baseline
+
+Nothing is fetched from the network: the tree is generated locally and MkDocs
+is only used to load the config, collect files and render Markdown.
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from mkdocs.config import load_config
+from mkdocs.structure.files import get_files
+from mkdocs.structure.nav import get_navigation
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from generate_docs import HOOKS, HOOKS_DIR, generate  # noqa: E402
+
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+# Baseline runs shorter than this are too noisy to gate on; they are still
+# reported, and their peak memory is still checked.
+MIN_SECONDS = 0.005
+
+SIZES = {
+    "small": {"pages": 200, "depth": 2, "fanout": 4, "index_tables": 2, "glossary": 100, "orphan_ratio": 0.1},
+    "medium": {"pages": 1000, "depth": 3, "fanout": 4, "index_tables": 2, "glossary": 300, "orphan_ratio": 0.1},
+    "large": {"pages": 5000, "depth": 4, "fanout": 5, "index_tables": 3, "glossary": 800, "orphan_ratio": 0.15},
+}
+
+
+class Site:
+    """A generated tree with its config, files, nav, and pre-rendered pages."""
+
+    def __init__(self, root):
+        self.config = load_config(config_file=os.path.join(root, "mkdocs.yml"), site_dir=os.path.join(root, "site"))
+        self.files = get_files(self.config)
+        self.nav = get_navigation(self.files, self.config)
+        self.pages = [f.page for f in self.files.documentation_pages() if f.page is not None]
+        for page in self.pages:
+            page.read_source(self.config)
+            page.render(self.config, self.files)
+        self.markdown = {id(page): page.markdown for page in self.pages}
+        self.parents = {id(page): page.parent for page in self.pages}
+
+    def reset_pages(self):
+        """Undo what synthesize_ancestors changed on the previous run."""
+        for page in self.pages:
+            page.parent = self.parents[id(page)]
+
+
+def load_hooks(cold):
+    """Return {name: module} for the hooks, re-executed when ``cold`` is set."""
+    if cold:
+        _reset_shared_state()
+    if cold or not _loaded:
+        for name in HOOKS:
+            path = os.path.join(HOOKS_DIR, name)
+            spec = importlib.util.spec_from_file_location(f"hooks/{name}", path)
+            module = importlib.util.module_from_spec(spec)
+            old_sys_path = sys.path.copy()
+            sys.path.insert(0, HOOKS_DIR)
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                sys.path[:] = old_sys_path
+            _loaded[os.path.splitext(name)[0]] = module
+    return _loaded
+
+
+_loaded = {}
+
+
+def _reset_shared_state():
+    for name in ("_hook_state", "_frontmatter", "_nav_graph", "_nav_index", "_page_deps"):
+        sys.modules.pop(name, None)
+
+
+# Each case is (name, prepare, run). ``run`` calls the entry point under test
+# (for every page, where it is a page event); the set-up events it depends on
+# (on_pre_build, on_files, on_nav) run in ``prepare`` and are not timed.
+
+def _auto_index_prepare(site, hooks):
+    hooks["auto_index_table"].on_pre_build(site.config)
+
+
+def _auto_index_files(site, hooks):
+    hooks["auto_index_table"].on_files(site.files, site.config)
+
+
+def _auto_index_markdown(site, hooks):
+    hook = hooks["auto_index_table"]
+    for page in site.pages:
+        hook.on_page_markdown(site.markdown[id(page)], page=page, config=site.config, files=site.files)
+
+
+def _auto_index_markdown_prepare(site, hooks):
+    _auto_index_prepare(site, hooks)
+    _auto_index_files(site, hooks)
+
+
+def _glossary_prepare(site, hooks):
+    hooks["glossary_abbreviations"].on_pre_build(site.config)
+
+
+def _glossary_content(site, hooks):
+    hook = hooks["glossary_abbreviations"]
+    for page in site.pages:
+        hook.on_page_content(page.content, page=page, config=site.config, files=site.files)
+
+
+def _footer_prepare(site, hooks):
+    hooks["footer_nav"].on_pre_build(site.config)
+
+
+def _footer_nav(site, hooks):
+    hooks["footer_nav"].on_nav(site.nav, config=site.config, files=site.files)
+
+
+def _ancestors_prepare(site, hooks):
+    site.reset_pages()
+    hooks["synthesize_ancestors"].on_pre_build(site.config)
+
+
+def _ancestors_nav(site, hooks):
+    hooks["synthesize_ancestors"].on_nav(site.nav, config=site.config, files=site.files)
+
+
+def _ancestors_context_prepare(site, hooks):
+    _ancestors_prepare(site, hooks)
+    _ancestors_nav(site, hooks)
+
+
+def _ancestors_context(site, hooks):
+    hook = hooks["synthesize_ancestors"]
+    for page in site.pages:
+        hook.on_page_context({}, page=page, config=site.config, nav=site.nav)
+
+
+CASES = [
+    ("auto_index_table.on_files", _auto_index_prepare, _auto_index_files),
+    ("auto_index_table.on_page_markdown", _auto_index_markdown_prepare, _auto_index_markdown),
+    ("glossary_abbreviations.on_page_content", _glossary_prepare, _glossary_content),
+    ("footer_nav.on_nav", _footer_prepare, _footer_nav),
+    ("synthesize_ancestors.on_nav", _ancestors_prepare, _ancestors_nav),
+    ("synthesize_ancestors.on_page_context", _ancestors_context_prepare, _ancestors_context),
+]
+
+
+def run_case(site, prepare, run, cold, repeat):
+    """Return (best seconds, peak memory in KiB) for one case."""
+    best = None
+    for _ in range(repeat):
+        hooks = load_hooks(cold)
+        prepare(site, hooks)
+        gc.collect()
+        start = time.perf_counter()
+        run(site, hooks)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    hooks = load_hooks(cold)
+    prepare(site, hooks)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(site, hooks)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak // 1024
+
+
+def run_suite(size, repeat, workdir):
+    generate(workdir, **SIZES[size])
+    cwd = os.getcwd()
+    # Hooks resolve .cache/ and relative paths next to mkdocs.yml.
+    os.chdir(workdir)
+    try:
+        site = Site(workdir)
+        results = {}
+        for name, prepare, run in CASES:
+            for mode in ("cold", "warm"):
+                if mode == "warm":
+                    load_hooks(cold=False)
+                    prepare(site, _loaded)
+                    run(site, _loaded)  # populate the state a rebuild would reuse
+                seconds, peak_kb = run_case(site, prepare, run, mode == "cold", repeat)
+                results[f"{name} [{mode}]"] = {
+                    "items": len(site.pages),
+                    "seconds": round(seconds, 6),
+                    "per_second": round(len(site.pages) / seconds, 1) if seconds else None,
+                    "peak_kb": peak_kb,
+                }
+    finally:
+        os.chdir(cwd)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of human-readable regressions against ``baseline``."""
+    regressions = []
+    for case, base in baseline.items():
+        current = results.get(case)
+        if current is None:
+            continue
+        if base.get("seconds", 0) >= MIN_SECONDS and current["per_second"] is not None:
+            if current["per_second"] < base["per_second"] * (1 - tolerance):
+                regressions.append(
+                    f"{case}: {current['per_second']:.0f}/s vs baseline {base['per_second']:.0f}/s"
+                )
+        if base.get("peak_kb") and current["peak_kb"] > base["peak_kb"] * (1 + tolerance) + 64:
+            regressions.append(f"{case}: peak {current['peak_kb']} KiB vs baseline {base['peak_kb']} KiB")
+    return regressions
+
+
+def _print_table(results, baseline):
+    print(f"{'case':<48} {'items/s':>10} {'baseline':>10} {'peak KiB':>9}")
+    for case, data in results.items():
+        base = baseline.get(case, {}).get("per_second")
+        base_text = f"{base:.0f}" if base else "-"
+        print(f"{case:<48} {data['per_second'] or 0:>10.0f} {base_text:>10} {data['peak_kb']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MkDocs hooks against a synthetic docs tree.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is kept")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed regression (default: 0.3 = 30%%)")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--json", metavar="FILE", help="Also write the results to FILE")
+    parser.add_argument("--keep", metavar="DIR", help="Generate the tree in DIR and keep it")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hook-bench-") as tmp:
+        workdir = os.path.abspath(args.keep) if args.keep else os.path.join(tmp, "site")
+        results = run_suite(args.size, args.repeat, workdir)
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = json.load(f)
+    except (OSError, ValueError):
+        baselines = {}
+    baseline = baselines.get(args.size, {})
+
+    _print_table(results, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"size": args.size, "results": results}, f, indent=2)
+
+    if args.update_baseline:
+        baselines[args.size] = results
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline for '{args.size}' written to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline for '{args.size}'; run with --update-baseline to record one.")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nRegressions beyond {:.0%}:".format(args.tolerance))
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Shared helper for the MkDocs hooks: the URL path the site is served under.
+
+Not a hook itself. The site is normally served from the root of its domain,
+but a preview deployment (e.g. GitHub Pages at ``/polkadot-mkdocs/``) serves
+it under a sub-path. Hooks that write or check absolute links ask this module
+for that prefix instead of parsing ``site_url`` themselves:
+
+  base_path(config)  → "" or "/polkadot-mkdocs"
+
+``extra.base_path`` wins when set (mkdocs.yml reads it from
+``DOCS_BASE_PATH``), otherwise the path of ``site_url`` is used.
+"""
+
+from urllib.parse import urlsplit
+
+
+def base_path(config):
+    """Return the base path without a trailing slash, or "" for the domain root."""
+    extra = config.get("extra") or {}
+    value = extra.get("base_path") or urlsplit(config.get("site_url") or "").path
+    value = str(value).strip().strip("/")
+    return f"/{value}" if value else ""
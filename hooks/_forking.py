@@ -0,0 +1,23 @@
+"""Shared helper for the MkDocs hooks: whether work may be spread over forked processes.
+
+Not a hook itself. Hooks that fan work out to worker processes (deferred
+glossary annotation, link_check's page scan) ask this module first and fall
+back to running serially when it says no:
+
+  if _forking.can_fork(command):   # command as passed to on_startup
+      ...start forked workers...
+
+Forking copies only the calling thread, so locks held by any other thread
+(the dev server's livereload and file watcher threads under ``mkdocs serve``)
+would stay locked in the child forever.
+"""
+
+import multiprocessing
+import threading
+
+
+def can_fork(command=None):
+    """Whether the platform supports ``fork`` and no other thread is running."""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return False
+    return command != "serve" and threading.active_count() == 1
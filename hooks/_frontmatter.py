@@ -0,0 +1,197 @@
+"""Shared helper for the MkDocs hooks: build-wide frontmatter store.
+
+Not a hook itself (it is not listed under ``hooks:`` in mkdocs.yml). MkDocs
+puts the hooks directory on ``sys.path`` while loading a hook, so hooks import
+it as a sibling module and share the single ``store`` instance below.
+
+Each markdown file's frontmatter is parsed at most once per (path, mtime, size)
+signature. Files that have not changed between ``mkdocs serve`` rebuilds keep
+their parsed entry; edited files are re-read automatically.
+
+The store keeps hit/miss counters so a build can confirm that the number of
+parses matches the number of distinct pages read:
+
+  store.stats()  → {"hits": 41, "misses": 12, "entries": 12}
+
+Files are read with ``read_frontmatter``, which streams only the header lines
+(up to the closing ``---``) and never loads the page body.
+
+``header_contains`` is a cheaper byte-level test for hooks that only care about
+a rarely-set key: it memory-maps the file and searches the header region for
+the key's bytes, so the YAML parser only runs for files that pass the scan.
+"""
+
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from mkdocs.utils.meta import get_data
+
+# Reading many small files is latency-bound rather than CPU-bound, so the
+# prefetch pool is sized well above the core count.
+PREFETCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_FRESH = object()
+
+_YAML_OPEN_RE = re.compile(r"-{3}[ \t]*\n\Z")
+_YAML_CLOSE_RE = re.compile(r"(?:\.{3}|-{3})[ \t]*\n\Z")
+_MMD_LINE_RE = re.compile(r"[ ]{0,3}[A-Za-z0-9_-]+:|[ ]{4}|\t")
+
+_BOM = b"\xef\xbb\xbf"
+_YAML_OPEN_BYTES_RE = re.compile(rb"-{3}[ \t]*\r?\n")
+_YAML_CLOSE_BYTES_RE = re.compile(rb"\n(?:\.{3}|-{3})[ \t]*\r?\n")
+_BLANK_LINE_BYTES_RE = re.compile(rb"\n[ \t]*\r?\n")
+
+
+class FrontmatterStore:
+    """Memoized ``path → frontmatter dict`` lookups keyed by file signature."""
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        """Return the frontmatter of ``path`` as a dict ({} if missing or invalid).
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        signature = file_signature(path)
+        if signature is None:
+            return {}
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        meta = read_frontmatter(path)
+        self._entries[path] = (signature, meta)
+        return meta
+
+    def prefetch(self, paths, max_workers=PREFETCH_WORKERS):
+        """Read and parse every missing or stale entry among ``paths`` concurrently.
+
+        Workers only stat, read and parse; results are stored from the calling
+        thread, so the store needs no locking. Returns the number of files parsed.
+        """
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return 0
+
+        def load(path):
+            signature = file_signature(path)
+            if signature is None:
+                return signature, _FRESH
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                return signature, _FRESH
+            return signature, read_frontmatter(path)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(load, paths))
+
+        parsed = 0
+        for path, (signature, meta) in zip(paths, results):
+            if meta is _FRESH:
+                continue
+            self._entries[path] = (signature, meta)
+            parsed += 1
+        self.misses += parsed
+        return parsed
+
+    def reset_stats(self):
+        """Zero the hit/miss counters; cached entries are kept."""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+def file_signature(path):
+    """Return the (mtime_ns, size) pair the store keys entries on, or None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def read_frontmatter(path):
+    """Return the frontmatter of a markdown file without reading its body.
+
+    Gives the same result as ``get_data(f.read())[1]``: only the header lines
+    are passed to ``get_data``, which is enough for both YAML (``---``
+    delimited) and MultiMarkdown-style metadata. Returns {} on any error.
+    """
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            _, meta = get_data(_read_header(f))
+        return meta or {}
+    except Exception:
+        return {}
+
+
+def header_contains(path, token):
+    """Return False if ``token`` (bytes) cannot appear in the file's frontmatter.
+
+    A True result only means the token occurs in the header region; callers
+    still parse the frontmatter to read the value. MultiMarkdown-style keys
+    are lower-cased by ``get_data``, so that form is matched case-insensitively.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _header_contains(mm, token)
+    except (OSError, ValueError):
+        # Unreadable here; let the full parser decide.
+        return True
+
+
+def _header_contains(mm, token):
+    start = len(_BOM) if mm[:len(_BOM)] == _BOM else 0
+
+    opening = _YAML_OPEN_BYTES_RE.match(mm, start)
+    if opening:
+        # The closing delimiter must follow at least one line of content.
+        closing = _YAML_CLOSE_BYTES_RE.search(mm, opening.end())
+        if closing is None:
+            return False
+        return mm.find(token, opening.end(), closing.start()) != -1
+
+    blank = _BLANK_LINE_BYTES_RE.search(mm, start)
+    end = blank.start() if blank else len(mm)
+    return token.lower() in mm[start:end].lower()
+
+
+def _read_header(f):
+    first = f.readline()
+    if not first:
+        return ""
+
+    lines = [first]
+    if _YAML_OPEN_RE.match(first):
+        # get_data needs at least one line between the delimiters, so a
+        # delimiter straight after the opening one does not close the block.
+        for line in f:
+            lines.append(line)
+            if len(lines) > 2 and _YAML_CLOSE_RE.match(line):
+                break
+        return "".join(lines)
+
+    # MultiMarkdown metadata ends at the first blank or non-metadata line.
+    if not first.strip() or not _MMD_LINE_RE.match(first):
+        return first
+    for line in f:
+        lines.append(line)
+        if not line.strip() or not _MMD_LINE_RE.match(line):
+            break
+    return "".join(lines)
+
+
+store = FrontmatterStore()
@@ -0,0 +1,24 @@
+"""Shared helper for the MkDocs hooks: state that survives `mkdocs serve` rebuilds.
+
+Not a hook itself. MkDocs reloads mkdocs.yml on every live-reload rebuild and
+re-executes each hook file while doing so, which resets the hook's module
+globals. Sibling modules like this one are imported normally, stay in
+``sys.modules`` and keep their state, so hooks that want to reuse work from
+the previous rebuild keep it here:
+
+  _table_cache = _hook_state.persistent("auto_index.tables")
+
+Anything stored here must be validated before reuse (by mtime, content hash,
+etc.); nothing is cleared automatically between builds.
+"""
+
+_namespaces = {}
+
+
+def persistent(name, factory=dict):
+    """Return the object registered under ``name``, creating it with ``factory``."""
+    try:
+        return _namespaces[name]
+    except KeyError:
+        value = _namespaces[name] = factory()
+        return value
@@ -0,0 +1,65 @@
+"""Shared helper for the MkDocs hooks: fast extraction of ids and links from built HTML.
+
+Not a hook itself. ``link_check`` uses it to scan every page of the built site.
+The worker functions live here rather than in the hook because they have to
+be picklable by name for a process pool, and hook modules are loaded under a
+file-path name that cannot be re-imported.
+
+  ids, hrefs = scan_file("site/develop/index.html")
+  → ({"overview", "install"}, ["../", "tools/#usage", "https://github.com/"])
+
+Scanning is regex-based: the pages are MkDocs output (possibly minified, so
+attribute values may be unquoted) and only ``id``/``name`` attributes and
+``<a href>`` values are needed, which is far cheaper than building a DOM.
+"""
+
+import html
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import _forking
+
+_ATTR_VALUE = r"""(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))"""
+# Matches id/name attributes anywhere; a stray match in text only makes the
+# anchor set more permissive.
+_ID_RE = re.compile(r"\s(?:id|name)\s*=\s*" + _ATTR_VALUE)
+_HREF_RE = re.compile(r"<a\s[^>]*?\bhref\s*=\s*" + _ATTR_VALUE, re.IGNORECASE)
+_SKIP_RE = re.compile(r"<(script|style|pre|code)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def scan_html(content):
+    """Return (set of element ids, list of distinct ``<a href>`` values)."""
+    content = _COMMENT_RE.sub("", content)
+    ids = {html.unescape(_value(m)) for m in _ID_RE.finditer(content)}
+    # Links shown inside code samples are not real links.
+    content = _SKIP_RE.sub("", content)
+    hrefs = dict.fromkeys(html.unescape(_value(m)).strip() for m in _HREF_RE.finditer(content))
+    return ids, list(hrefs)
+
+
+def scan_file(path):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return scan_html(f.read())
+
+
+def scan_files(paths, workers=None, command=None):
+    """Return ``{path: (ids, hrefs)}``, spreading the work over forked processes.
+
+    ``command`` is the MkDocs command from on_startup; under ``serve`` (or with
+    any other thread running) the files are scanned in-process.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    if workers == 1 or not _forking.can_fork(command):
+        return {path: scan_file(path) for path in paths}
+
+    chunksize = max(1, len(paths) // (workers * 8))
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return dict(zip(paths, pool.map(scan_file, paths, chunksize=chunksize)))
+
+
+def _value(match):
+    return next(g for g in match.groups() if g is not None)
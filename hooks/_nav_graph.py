@@ -0,0 +1,125 @@
+"""Shared helper for the MkDocs hooks: directory → parsed .nav.yml graph.
+
+Not a hook itself. Hooks import it as a sibling module and query the single
+``graph`` instance below instead of opening ``.nav.yml`` files themselves, so
+each file is parsed once per build no matter how many hooks, index blocks or
+recursive walks reach it.
+
+Every node is validated against the file's mtime the first time it is
+requested in a build (see ``begin_build``); later lookups in the same build are
+served from memory. Under ``mkdocs serve`` only edited ``.nav.yml`` files are
+re-parsed on the next rebuild.
+
+Nav entries can point at other directories (``- Tools: tools``), which makes
+the set of ``.nav.yml`` files a graph rather than a tree. ``descend`` guards
+recursive walks against self-referencing navs:
+
+  path = graph.descend(directory, path)
+  if path is None:
+      return []  # directory is already being expanded — cycle
+"""
+
+import logging
+import os
+
+import yaml
+
+log = logging.getLogger("mkdocs")
+
+NAV_FILE = ".nav.yml"
+
+
+class NavNode:
+    """Parsed contents of one directory's .nav.yml."""
+
+    __slots__ = ("directory", "exists", "meta", "items", "mtime")
+
+    def __init__(self, directory, exists=False, data=None, mtime=None):
+        self.directory = directory
+        self.exists = exists
+        self.mtime = mtime
+        self.meta = data if isinstance(data, dict) else {}
+        if isinstance(data, list):
+            self.items = data
+        else:
+            items = self.meta.get("nav", [])
+            self.items = items if isinstance(items, list) else []
+
+    @property
+    def title(self):
+        title = self.meta.get("title")
+        return title if isinstance(title, str) else None
+
+    def get(self, key, default=None):
+        return self.meta.get(key, default)
+
+
+class NavGraph:
+    """Memoized ``directory → NavNode`` lookups with per-build mtime checks."""
+
+    def __init__(self):
+        self._nodes = {}
+        self._checked = set()
+        self._cycles_reported = set()
+
+    def begin_build(self):
+        """Mark every cached node for revalidation on its next lookup."""
+        self._checked = set()
+        self._cycles_reported = set()
+
+    def node(self, directory):
+        """Return the NavNode for an absolute directory path."""
+        directory = os.path.normpath(directory)
+        cached = self._nodes.get(directory)
+        if cached is not None and directory in self._checked:
+            return cached
+
+        nav_path = os.path.join(directory, NAV_FILE)
+        try:
+            mtime = os.stat(nav_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if cached is None or cached.mtime != mtime:
+            cached = self._parse(directory, nav_path, mtime)
+            self._nodes[directory] = cached
+        self._checked.add(directory)
+        return cached
+
+    def exists(self, directory):
+        return self.node(directory).exists
+
+    def items(self, directory):
+        return self.node(directory).items
+
+    def title(self, directory):
+        return self.node(directory).title
+
+    def descend(self, directory, path):
+        """Return ``path`` extended with ``directory``, or None on a cycle.
+
+        ``path`` is the tuple of directories currently being expanded by a
+        recursive walk (outermost first). A cycle is logged once per build.
+        """
+        directory = os.path.normpath(directory)
+        if directory in path:
+            cycle = path[path.index(directory):] + (directory,)
+            if cycle not in self._cycles_reported:
+                self._cycles_reported.add(cycle)
+                log.warning(f"nav graph: {NAV_FILE} cycle detected: {' → '.join(cycle)} — not expanding")
+            return None
+        return path + (directory,)
+
+    def _parse(self, directory, nav_path, mtime):
+        if mtime is None:
+            return NavNode(directory)
+        try:
+            with open(nav_path, encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            log.debug(f"nav graph: could not parse {nav_path}: {e}")
+            data = {}
+        return NavNode(directory, exists=True, data=data, mtime=mtime)
+
+
+graph = NavGraph()
@@ -0,0 +1,84 @@
+"""Shared helper for the MkDocs hooks: precomputed lookups over the MkDocs Nav.
+
+Not a hook itself. ``footer_nav`` and ``synthesize_ancestors`` both need facts
+about the nav tree; instead of each walking it (and re-walking subtrees for
+every section), the first hook to ask builds a ``NavIndex`` in one traversal
+and the other reuses it for the same ``Nav`` object:
+
+  index = _nav_index.index_for(nav)
+  index.dir_ancestors["code-reviews/pr-reviews"]  → [Code Reviews, PR Reviews]
+  index.section_dir(section)                       → "code-reviews"
+  index.first_page_url(section)                    → "code-reviews/overview/"
+  index.page_position(page)                        → 12
+
+Sections and pages are keyed by identity (MkDocs pages define ``__eq__`` and
+are not hashable); the index holds a reference to its nav so the keys stay
+valid for the lifetime of the build.
+"""
+
+import os
+
+from mkdocs.structure.nav import Section
+from mkdocs.structure.pages import Page
+
+
+class NavIndex:
+    """Lookups computed in a single depth-first walk of a Nav."""
+
+    def __init__(self, nav):
+        self.nav = nav
+        # Normalised relative dir → ancestor Sections (root → leaf) of the
+        # first nav page found in that directory.
+        self.dir_ancestors = {}
+        self.pages = []
+        self._section_dirs = {}
+        self._first_urls = {}
+        self._positions = {}
+        self._walk(nav.items, [])
+
+    def section_dir(self, section):
+        """Relative source dir of a section's first direct Page child, or None."""
+        return self._section_dirs.get(id(section))
+
+    def first_page_url(self, section):
+        """URL of the first page anywhere in a section's subtree, or None."""
+        return self._first_urls.get(id(section))
+
+    def page_position(self, page):
+        """Zero-based position of a page in nav order, or None if not in the nav."""
+        return self._positions.get(id(page))
+
+    def _walk(self, items, ancestors):
+        first_url = None
+        parent = ancestors[-1] if ancestors else None
+
+        for item in items:
+            if isinstance(item, Section):
+                url = self._walk(item.children, ancestors + [item])
+                self._first_urls[id(item)] = url
+                if first_url is None and url:
+                    first_url = url
+
+            elif isinstance(item, Page):
+                self._positions[id(item)] = len(self.pages)
+                self.pages.append(item)
+                if item.file:
+                    src_dir = os.path.dirname(item.file.src_path)
+                    self.dir_ancestors.setdefault(os.path.normpath(src_dir), list(ancestors))
+                    if parent is not None:
+                        self._section_dirs.setdefault(id(parent), src_dir)
+                if first_url is None and item.url:
+                    first_url = item.url
+
+        return first_url
+
+
+_index = None
+
+
+def index_for(nav):
+    """Return the NavIndex for ``nav``, building it on first use."""
+    global _index
+    if _index is None or _index.nav is not nav:
+        _index = NavIndex(nav)
+    return _index
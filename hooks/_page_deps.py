@@ -0,0 +1,140 @@
+"""Shared helper for the MkDocs hooks: which source files each page was rendered from.
+
+Not a hook itself. Hooks that read files other than the page being rendered
+record them here, so a dirty rebuild can tell which pages an edit affects:
+
+  graph.record(page.file.abs_src_path, "/docs/reference/glossary.md")
+  graph.record_global("footer_nav", footer_items)   # shown on every page
+
+Each edge stores the dependency's signature at the time it was read (file
+mtime and size, or the sorted listing for a directory, None if missing).
+``stale_pages`` later returns every page with a dependency whose signature
+has changed since. Global values are compared as a whole; when one changes,
+or no previous build is known, every page is stale.
+
+The graph is module state and so survives `mkdocs serve` rebuilds; the
+page_dependencies hook also saves it between `mkdocs build --dirty` runs.
+"""
+
+import hashlib
+import json
+import os
+import stat
+
+
+class DependencyGraph:
+    """``page source path → {dependency path: signature}`` plus build-wide values."""
+
+    def __init__(self):
+        self._edges = {}
+        self._globals = {}
+        self._previous_globals = None
+        self._signatures = {}
+        self._paths = {}
+
+    def begin_build(self):
+        """Forget this process's cached signatures and the previous build's globals."""
+        self._signatures = {}
+        self._globals = {}
+
+    def end_build(self):
+        self._previous_globals = dict(self._globals)
+
+    @property
+    def known(self):
+        """Whether a completed build's graph is available to compare against."""
+        return self._previous_globals is not None
+
+    def reset(self, page_path):
+        """Drop a page's edges before it is rendered again."""
+        self._edges[self._path(page_path)] = {}
+
+    def record(self, page_path, dep_path):
+        edges = self._edges.setdefault(self._path(page_path), {})
+        dep_path = self._path(dep_path)
+        if dep_path not in edges:
+            edges[dep_path] = self.signature(dep_path)
+
+    def record_global(self, name, value):
+        """Record a value that every page's output depends on."""
+        encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+        self._globals[name] = hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, path):
+        """Normalize ``path``, sharing one string per path across all edges."""
+        try:
+            return self._paths[path]
+        except KeyError:
+            normalized = self._paths[path] = os.path.normpath(path)
+            return normalized
+
+    def signature(self, path):
+        try:
+            return self._signatures[path]
+        except KeyError:
+            pass
+        try:
+            st = os.stat(path)
+        except OSError:
+            value = None
+        else:
+            if stat.S_ISDIR(st.st_mode):
+                try:
+                    value = sorted(os.listdir(path))
+                except OSError:
+                    value = None
+            else:
+                value = [st.st_mtime_ns, st.st_size]
+        self._signatures[path] = value
+        return value
+
+    def stale_pages(self):
+        """Return the set of pages to re-render, or None when every page must be."""
+        if self._previous_globals is None or self._previous_globals != self._globals:
+            return None
+        return {
+            page for page, edges in self._edges.items()
+            if any(self.signature(dep) != value for dep, value in edges.items())
+        }
+
+    def prune(self, page_paths):
+        """Forget pages that are no longer part of the site."""
+        keep = {os.path.normpath(p) for p in page_paths}
+        for page in [p for p in self._edges if p not in keep]:
+            del self._edges[page]
+
+    def dependencies(self):
+        """Return every recorded dependency path."""
+        return {dep for edges in self._edges.values() for dep in edges}
+
+    def stats(self):
+        return {
+            "pages": len(self._edges),
+            "edges": sum(len(edges) for edges in self._edges.values()),
+            "dependencies": len(self.dependencies()),
+        }
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"globals": self._previous_globals, "pages": self._edges}, f)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        """Load a saved graph; returns False (keeping the current one) if unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            edges = data["pages"]
+            previous = data["globals"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if not isinstance(edges, dict) or not isinstance(previous, dict):
+            return False
+        self._edges = edges
+        self._previous_globals = previous
+        return True
+
+
+graph = DependencyGraph()
@@ -0,0 +1,171 @@
+"""Shared helper for the MkDocs hooks: Aho-Corasick glossary term matcher.
+
+Not a hook itself. ``glossary_abbreviations`` uses it to find glossary terms in
+paragraph text. It replaces a single regex of the form
+
+  (?<![\\w-])(term one|term two|...)(?![\\w-])
+
+whose alternation backtracks through every term at every position. The
+automaton scans the text once, so matching cost is linear in the text length
+(plus the number of raw hits) however many terms the glossary has.
+
+Results are identical to that regex: matching is case-sensitive, a match must
+not touch a word character or hyphen on either side, matches never overlap,
+and at any position the longest term wins.
+
+  matcher = TermMatcher(["Relay Chain", "Relay", "XCM"])
+  list(matcher.finditer("The Relay Chain speaks XCM."))
+  → [(4, 15), (23, 26)]
+
+``TermIndex`` adds a cheap word-level prefilter in front of the matcher.
+"""
+
+import re
+from collections import OrderedDict
+
+
+def _is_word(ch):
+    """True for characters matched by ``[\\w-]`` in a Python str regex."""
+    return ch.isalnum() or ch == "_" or ch == "-"
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over a fixed set of terms."""
+
+    __slots__ = ("terms", "_goto", "_fail", "_length", "_output", "_first_chars")
+
+    def __init__(self, terms):
+        self.terms = tuple(dict.fromkeys(t for t in terms if t))
+        self._goto = [{}]
+        self._length = [0]
+
+        for term in self.terms:
+            state = 0
+            for ch in term:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._length.append(0)
+                state = nxt
+            self._length[state] = len(term)
+
+        self._first_chars = frozenset(self._goto[0])
+        self._build_links()
+
+    def _build_links(self):
+        goto, length = self._goto, self._length
+        fail = [0] * len(goto)
+        # output[s]: nearest state on s's fail chain (s included) that ends a term.
+        output = [0] * len(goto)
+
+        queue = list(goto[0].values())
+        for state in queue:
+            output[state] = state if length[state] else 0
+
+        i = 0
+        while i < len(queue):
+            state = queue[i]
+            i += 1
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(ch, 0)
+                fail[nxt] = f if f != nxt else 0
+                output[nxt] = nxt if length[nxt] else output[fail[nxt]]
+                queue.append(nxt)
+
+        self._fail = fail
+        self._output = output
+
+    def __bool__(self):
+        return bool(self.terms)
+
+    def finditer(self, text):
+        """Yield ``(start, end)`` for each match in ``text``, left to right."""
+        goto, fail, length, output = self._goto, self._fail, self._length, self._output
+        first_chars = self._first_chars
+        size = len(text)
+        best = {}
+        state = 0
+
+        for j, ch in enumerate(text):
+            if not state and ch not in first_chars:
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            node = output[state]
+            if not node or (j + 1 < size and _is_word(text[j + 1])):
+                continue
+            while node:
+                term_length = length[node]
+                start = j + 1 - term_length
+                if (start == 0 or not _is_word(text[start - 1])) and best.get(start, 0) < term_length:
+                    best[start] = term_length
+                node = output[fail[node]]
+
+        last_end = 0
+        for start in sorted(best):
+            if start >= last_end:
+                last_end = start + best[start]
+                yield start, last_end
+
+
+_WORD_RE = re.compile(r"[\w-]+")
+
+
+class TermIndex:
+    """Word-level prefilter that narrows a page down to the terms it can contain.
+
+    A term can only match where every ``[\\w-]+`` run in it appears as a whole
+    run in the text (matches are bounded by non-word characters), so one
+    C-level ``findall`` over the page rules out most of the glossary before any
+    per-character matching happens. Pages whose candidate set is empty can skip
+    HTML processing altogether; the rest get a matcher built from their
+    candidates only, cached per candidate set. The cache keeps the
+    ``max_matchers`` most recently used matchers.
+    """
+
+    def __init__(self, terms, max_matchers=256):
+        self.terms = tuple(dict.fromkeys(t for t in terms if t))
+        self.matcher = TermMatcher(self.terms)
+        self._by_first_word = {}
+        self._always = []
+        self._matchers = OrderedDict()
+        self._max_matchers = max_matchers
+
+        for term in self.terms:
+            words = _WORD_RE.findall(term)
+            if words:
+                self._by_first_word.setdefault(words[0], []).append((term, words[1:]))
+            else:
+                self._always.append(term)
+
+    def candidates(self, text):
+        """Return the frozenset of terms that may occur in ``text`` (unescaped)."""
+        found = list(self._always)
+        words = set(_WORD_RE.findall(text))
+        for word in words.intersection(self._by_first_word):
+            for term, rest in self._by_first_word[word]:
+                if all(w in words for w in rest):
+                    found.append(term)
+        return frozenset(found)
+
+    def matcher_for(self, candidates):
+        """Return a TermMatcher restricted to ``candidates``."""
+        if len(candidates) == len(self.terms):
+            return self.matcher
+        matcher = self._matchers.get(candidates)
+        if matcher is not None:
+            self._matchers.move_to_end(candidates)
+            return matcher
+        if len(self._matchers) >= self._max_matchers:
+            self._matchers.popitem(last=False)
+        matcher = self._matchers[candidates] = TermMatcher(
+            t for t in self.terms if t in candidates
+        )
+        return matcher
@@ -43,13 +43,43 @@ Fields used per row:
   difficulty  - from page_badges.tutorial_badge frontmatter; shows N/A if absent
 
 Note: index.md files are always skipped regardless of nav configuration.
+
+Frontmatter is read through the build-wide store in _frontmatter.py, so a page
+listed by several blocks (or several index pages) is only parsed once per
+build. Run `mkdocs build -v` to see the store's hit/miss counters. Likewise,
+.nav.yml files are parsed once per build through the shared graph in
+_nav_graph.py, which also stops self-referencing navs from recursing forever.
+
+Paths are resolved against an in-memory index of the MkDocs Files collection
+(built in on_files) rather than the filesystem, so listing a directory or
+checking that a page exists costs no syscalls.
+
+Generated tables are cached (across `mkdocs serve` rebuilds too) under the
+block's scan directory and normalized config. Each entry records what it was
+built from — the .nav.yml files, directory listings and page files it read —
+and is reused only while all of those are unchanged, so editing one page's
+short_description re-renders just the tables that list that page. The same
+dependencies are recorded for the page holding the block in _page_deps.py, so
+dirty rebuilds re-render it too (see page_dependencies).
+
+Before any page is rendered, on_files scans the docs for INDEX TABLE blocks,
+works out every page those blocks will list and parses their frontmatter in a
+bounded thread pool, so on_page_markdown only has to assemble rows.
 """
 
+import functools
+import json
 import os
 import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+
+from mkdocs.plugins import event_priority
 
-from mkdocs.utils.meta import get_data
+import _frontmatter
+import _hook_state
+import _nav_graph
+import _page_deps
 
 import logging
 log = logging.getLogger('mkdocs')
@@ -81,9 +111,150 @@ DIFFICULTY_MAP = {
     'advanced':     '🔴 Advanced',
 }
 
+_paths = None
+
+# (scan_dir, normalized block config) → (dependency fingerprint, generated markdown)
+_table_cache = _hook_state.persistent('auto_index.tables')
+_table_stats = {'reused': 0, 'rendered': 0}
+
+# Dependency fingerprint collected while a table is being generated.
+_recording = None
+
+# page path → (file signature, [(dir config, flat), ...] for each block on it)
+_block_scan = _hook_state.persistent('auto_index.block_scan')
+
+
+class _PathIndex:
+    """Docs inventory from the MkDocs Files collection: file paths plus dir → children."""
+
+    def __init__(self, files, docs_dir):
+        root = os.path.normpath(docs_dir)
+        prefix = root.rstrip(os.sep) + os.sep
+        self.files = set()
+        self.dirs = {root: []}
+
+        for file in files:
+            if not file.abs_src_path:
+                continue
+            path = os.path.normpath(file.abs_src_path)
+            if not path.startswith(prefix):
+                continue  # theme files and other sources outside docs_dir
+            self.files.add(path)
+            parent = os.path.dirname(path)
+            children = self.dirs.get(parent)
+            if children is None:
+                children = self._add_dir(parent)
+            children.append(os.path.basename(path))
+
+        for children in self.dirs.values():
+            children.sort()
+
+    def _add_dir(self, path):
+        children = self.dirs[path] = []
+        parent = os.path.dirname(path)
+        while parent not in self.dirs:
+            self.dirs[parent] = []
+            parent = os.path.dirname(parent)
+        return children
+
+    def isfile(self, path):
+        return path in self.files
+
+    def isdir(self, path):
+        return path in self.dirs
+
+    def listdir(self, path):
+        return self.dirs.get(path, [])
+
+
+def on_pre_build(config, **kwargs):
+    global _paths
+    _paths = None
+    _table_stats.update(reused=0, rendered=0)
+    _frontmatter.store.reset_stats()
+    _nav_graph.graph.begin_build()
+
+
+# Run before other plugins so the index reflects everything in docs_dir, even
+# pages a plugin later removes from the collection.
+@event_priority(100)
+def on_files(files, config, **kwargs):
+    global _paths
+    _paths = _PathIndex(files, config['docs_dir'])
+    _resolve.cache_clear()
+    _prefetch(files, config['docs_dir'])
+    return files
+
+
+def _prefetch(files, docs_dir):
+    """Parse the frontmatter of every page listed by an INDEX TABLE block, concurrently."""
+    pages = [
+        os.path.normpath(f.abs_src_path) for f in files
+        if f.abs_src_path and f.src_uri.endswith('.md')
+    ]
+    pages = [p for p in pages if _paths.isfile(p)]
+    with ThreadPoolExecutor(max_workers=_frontmatter.PREFETCH_WORKERS) as pool:
+        scans = list(pool.map(_scan_blocks, pages))
+
+    listed = []
+    for page_path, blocks in zip(pages, scans):
+        page_dir = os.path.dirname(page_path)
+        for dir_config, flat in blocks:
+            scan_dir = _resolve(page_dir, str(dir_config), docs_dir) if dir_config else page_dir
+            if not scan_dir or not _paths.isdir(scan_dir) or not _nav_graph.graph.exists(scan_dir):
+                continue
+            if flat:
+                listed.extend(md_path for md_path, _ in _flat_pages(scan_dir, docs_dir))
+            else:
+                for _, section in _section_pages(scan_dir, docs_dir):
+                    listed.extend(md_path for md_path, _ in section)
+
+    parsed = _frontmatter.store.prefetch(listed)
+    log.debug(f"auto_index: prefetched frontmatter for {len(set(listed))} listed pages ({parsed} parsed)")
+
+
+def _scan_blocks(path):
+    """Return [(dir config, flat), ...] for the INDEX TABLE blocks in a page source."""
+    signature = _frontmatter.file_signature(path)
+    cached = _block_scan.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    blocks = []
+    try:
+        with open(path, encoding='utf-8-sig') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return blocks
+
+    if '<!-- INDEX TABLE START' in text:
+        for match in BLOCK_RE.finditer(text):
+            try:
+                cfg = _block_config(match.group(1))
+            except Exception:
+                cfg = {}
+            if isinstance(cfg, dict):
+                blocks.append((cfg.get('dir'), bool(cfg.get('flat', False))))
+
+    _block_scan[path] = (signature, blocks)
+    return blocks
+
+
+def _block_config(opening):
+    """Parse the optional YAML config of an INDEX TABLE opening comment."""
+    yaml_match = re.match(r'<!--\s*INDEX TABLE START\s*(.*?)-->', opening, re.DOTALL)
+    raw_config = yaml_match.group(1).strip() if yaml_match else ''
+    if not raw_config:
+        return {}
+    return yaml.safe_load(raw_config) or {}
+
+
 def on_page_markdown(markdown, page, config, files, **kwargs):
+    global _paths
     if '<!-- INDEX TABLE START' not in markdown:
         return markdown
+    if _paths is None:
+        _paths = _PathIndex(files, config['docs_dir'])
 
     docs_dir = config['docs_dir']
     page_dir = os.path.dirname(page.file.abs_src_path)
@@ -91,15 +262,11 @@ def on_page_markdown(markdown, page, config, files, **kwargs):
     def replace_block(match):
         opening = match.group(1)
 
-        yaml_match = re.match(r'<!--\s*INDEX TABLE START\s*(.*?)-->', opening, re.DOTALL)
-        raw_config = yaml_match.group(1).strip() if yaml_match else ''
-
-        cfg = {}
-        if raw_config:
-            try:
-                cfg = yaml.safe_load(raw_config) or {}
-            except Exception as e:
-                log.warning(f"auto_index: invalid YAML config in {page.file.src_path}: {e} — using defaults")
+        try:
+            cfg = _block_config(opening)
+        except Exception as e:
+            cfg = {}
+            log.warning(f"auto_index: invalid YAML config in {page.file.src_path}: {e} — using defaults")
 
         columns = cfg.get('columns', DEFAULT_COLUMNS)
         if isinstance(columns, str):
@@ -118,52 +285,100 @@ def on_page_markdown(markdown, page, config, files, **kwargs):
             if not scan_dir:
                 log.warning(f"auto_index: 'dir: {dir_config}' in {page.file.src_path} resolves outside docs_dir — skipping block")
                 return match.group(0)
-            if not os.path.isdir(scan_dir):
+            if not _paths.isdir(scan_dir):
                 log.warning(f"auto_index: 'dir: {dir_config}' in {page.file.src_path} does not exist — skipping block")
                 return match.group(0)
         else:
             scan_dir = page_dir
 
-        generated = _build_content(scan_dir, docs_dir, columns, flat, extra_rows, overrides)
+        generated = _cached_content(
+            scan_dir, cfg, page.file.abs_src_path,
+            lambda: _build_content(scan_dir, docs_dir, columns, flat, extra_rows, overrides),
+        )
         inner = f"\n\n{generated}\n" if generated else "\n"
         return f"{opening}{inner}{END_MARKER}"
 
     return BLOCK_RE.sub(replace_block, markdown)
 
 
+def on_post_build(config, **kwargs):
+    stats = _frontmatter.store.stats()
+    log.debug(
+        f"auto_index: frontmatter store — {stats['misses']} parsed, "
+        f"{stats['hits']} reused, {stats['entries']} cached"
+    )
+    log.debug(
+        f"auto_index: tables — {_table_stats['rendered']} rendered, "
+        f"{_table_stats['reused']} reused from cache"
+    )
+
+
+def _cached_content(scan_dir, cfg, page_path, build):
+    """Return build() output, reusing a cached table while its dependencies are unchanged.
+
+    The table's dependencies are also recorded as dependencies of the page
+    (``page_path``) it is rendered into, for dirty rebuilds.
+    """
+    global _recording
+    key = (scan_dir, json.dumps(cfg, sort_keys=True, default=str))
+
+    cached = _table_cache.get(key)
+    if cached is not None and all(_dep_value(*dep) == value for dep, value in cached[0].items()):
+        _table_stats['reused'] += 1
+        _record_page_deps(page_path, cached[0])
+        return cached[1]
+
+    _recording = {}
+    try:
+        generated = build()
+        _table_cache[key] = (_recording, generated)
+        _record_page_deps(page_path, _recording)
+    finally:
+        _recording = None
+    _table_stats['rendered'] += 1
+    return generated
+
+
+def _record_page_deps(page_path, deps):
+    for kind, path in deps:
+        if kind == 'nav':
+            path = os.path.join(path, _nav_graph.NAV_FILE)
+        _page_deps.graph.record(page_path, path)
+
+
+def _dep_value(kind, path):
+    if kind == 'nav':
+        return _nav_graph.graph.node(path).mtime
+    if kind == 'file':
+        return _paths.isfile(path)
+    if kind == 'dir':
+        return tuple(_paths.listdir(path)) if _paths.isdir(path) else None
+    return _frontmatter.file_signature(path)
+
+
+def _depends(kind, path):
+    """Record a dependency of the table being generated and return its current value."""
+    value = _dep_value(kind, path)
+    if _recording is not None:
+        _recording[(kind, path)] = value
+    return value
+
+
 def _build_content(scan_dir, docs_dir, columns, flat=False, extra_rows=None, overrides=None):
-    nav_path = os.path.join(scan_dir, '.nav.yml')
-    if not os.path.exists(nav_path):
+    _depends('nav', scan_dir)
+    if not _nav_graph.graph.exists(scan_dir):
         log.warning(f"auto_index: no .nav.yml found in {os.path.relpath(scan_dir, docs_dir)} — table will be empty")
         return ""
 
     header = '| ' + ' | '.join(COLUMN_HEADERS[c] for c in columns) + ' |'
     separator = '|' + '|'.join(':----------:' if c == 'difficulty' else '-------' for c in columns) + '|'
 
-    nav_items = _load_nav(nav_path)
-
     if flat:
         rows = []
-        for item in nav_items:
-            if not isinstance(item, dict):
-                continue
-            for nav_title, path in item.items():
-                if os.path.basename(str(path)) == 'index.md':
-                    continue
-                resolved = _resolve(scan_dir, str(path), docs_dir)
-                if not resolved:
-                    continue
-                nt = _strip_icons(nav_title)
-                if os.path.isfile(resolved) and resolved.endswith('.md'):
-                    row = _make_row(resolved, docs_dir, columns, nav_title=nt, overrides=overrides)
-                    if row:
-                        rows.append(row)
-                else:
-                    md_path = resolved.rstrip('/') + '.md'
-                    if os.path.isfile(md_path):
-                        row = _make_row(md_path, docs_dir, columns, nav_title=nt, overrides=overrides)
-                        if row:
-                            rows.append(row)
+        for md_path, nt in _flat_pages(scan_dir, docs_dir):
+            row = _make_row(md_path, docs_dir, columns, nav_title=nt, overrides=overrides)
+            if row:
+                rows.append(row)
         for er in (extra_rows or []):
             row = _make_extra_row(er, columns)
             if row:
@@ -173,25 +388,15 @@ def _build_content(scan_dir, docs_dir, columns, flat=False, extra_rows=None, ove
         return "\n".join([header, separator] + rows)
 
     sections = []
-    for item in nav_items:
-        if not isinstance(item, dict):
-            continue
-        for title, path in item.items():
-            if os.path.basename(str(path)) == 'index.md':
-                continue
-
-            resolved = _resolve(scan_dir, str(path), docs_dir)
-            if not resolved:
-                continue
-
-            rows = [r for r in (_make_row(f, docs_dir, columns, nav_title=nt, overrides=overrides) for f, nt in _collect_files(resolved, docs_dir)) if r]
+    for title, pages in _section_pages(scan_dir, docs_dir):
+        rows = [r for r in (_make_row(f, docs_dir, columns, nav_title=nt, overrides=overrides) for f, nt in pages) if r]
 
-            if rows:
-                sections.append(f"## {_strip_icons(title)}\n")
-                sections.append(header)
-                sections.append(separator)
-                sections.extend(rows)
-                sections.append("")
+        if rows:
+            sections.append(f"## {_strip_icons(title)}\n")
+            sections.append(header)
+            sections.append(separator)
+            sections.extend(rows)
+            sections.append("")
 
     if extra_rows:
         extra = [_make_extra_row(er, columns) for er in extra_rows]
@@ -205,8 +410,48 @@ def _build_content(scan_dir, docs_dir, columns, flat=False, extra_rows=None, ove
     return "\n".join(sections)
 
 
+def _flat_pages(scan_dir, docs_dir):
+    """Return the (md_path, nav_title) pairs a flat block lists, in nav order."""
+    pages = []
+    for item in _nav_graph.graph.items(scan_dir):
+        if not isinstance(item, dict):
+            continue
+        for nav_title, path in item.items():
+            if os.path.basename(str(path)) == 'index.md':
+                continue
+            resolved = _resolve(scan_dir, str(path), docs_dir)
+            if not resolved:
+                continue
+            nt = _strip_icons(nav_title)
+            if _depends('file', resolved) and resolved.endswith('.md'):
+                pages.append((resolved, nt))
+            else:
+                md_path = resolved.rstrip('/') + '.md'
+                if _depends('file', md_path):
+                    pages.append((md_path, nt))
+    return pages
+
+
+def _section_pages(scan_dir, docs_dir):
+    """Return (section_title, [(md_path, nav_title), ...]) per top-level nav entry."""
+    walk_path = (os.path.normpath(scan_dir),)
+    sections = []
+    for item in _nav_graph.graph.items(scan_dir):
+        if not isinstance(item, dict):
+            continue
+        for title, path in item.items():
+            if os.path.basename(str(path)) == 'index.md':
+                continue
+            resolved = _resolve(scan_dir, str(path), docs_dir)
+            if not resolved:
+                continue
+            sections.append((title, _collect_files(resolved, docs_dir, walk_path=walk_path)))
+    return sections
+
+
 def _make_row(md_path, docs_dir, columns, nav_title=None, overrides=None):
-    fm = _read_frontmatter(md_path)
+    _depends('page', md_path)
+    fm = _frontmatter.store.get(md_path)
     ov = (overrides or {}).get(os.path.basename(md_path)) or {}
 
     title = ov.get('title') or nav_title or (fm.get('title') or '').strip()
@@ -246,16 +491,23 @@ def _make_extra_row(row_data, columns):
     return '| ' + ' | '.join(data[c] for c in columns) + ' |'
 
 
-def _collect_files(path, docs_dir, nav_title=None):
-    """Recursively collect (md_path, nav_title) from a path, following .nav.yml files."""
-    if os.path.isfile(path) and path.endswith('.md'):
+def _collect_files(path, docs_dir, nav_title=None, walk_path=()):
+    """Recursively collect (md_path, nav_title) from a path, following .nav.yml files.
+
+    walk_path holds the directories currently being expanded; a directory that
+    is already on it (a self-referencing nav) is not expanded again.
+    """
+    if _depends('file', path) and path.endswith('.md'):
         return [(path, nav_title)]
 
-    if os.path.isdir(path):
-        sub_nav = os.path.join(path, '.nav.yml')
-        if os.path.exists(sub_nav):
+    if _depends('dir', path) is not None:
+        walk_path = _nav_graph.graph.descend(path, walk_path)
+        if walk_path is None:
+            return []
+        _depends('nav', path)
+        if _nav_graph.graph.exists(path):
             files = []
-            for item in _load_nav(sub_nav):
+            for item in _nav_graph.graph.items(path):
                 if not isinstance(item, dict):
                     continue
                 for item_title, sub_path in item.items():
@@ -263,16 +515,16 @@ def _collect_files(path, docs_dir, nav_title=None):
                         continue
                     resolved = _resolve(path, str(sub_path), docs_dir)
                     if resolved:
-                        files.extend(_collect_files(resolved, docs_dir, _strip_icons(item_title)))
+                        files.extend(_collect_files(resolved, docs_dir, _strip_icons(item_title), walk_path))
             return files
         return [
             (os.path.join(path, f), None)
-            for f in sorted(os.listdir(path))
+            for f in _paths.listdir(path)
             if f.endswith('.md') and f != 'index.md'
         ]
 
     md_path = path.rstrip('/') + '.md'
-    if os.path.isfile(md_path):
+    if _depends('file', md_path):
         return [(md_path, nav_title)]
 
     return []
@@ -289,30 +541,14 @@ def _strip_icons(text):
     return _ICON_RE.sub('', str(text)).strip()
 
 
-def _read_frontmatter(path):
-    try:
-        with open(path, encoding='utf-8-sig') as f:
-            _, meta = get_data(f.read())
-        return meta or {}
-    except Exception:
-        return {}
-
-
-def _load_nav(nav_path):
-    try:
-        with open(nav_path, encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
-        return data if isinstance(data, list) else data.get('nav', [])
-    except Exception:
-        return []
-
-
+@functools.lru_cache(maxsize=None)
 def _resolve(base_dir, path, docs_dir):
+    root = os.path.normpath(docs_dir)
     if path.startswith('/'):
-        resolved = os.path.normpath(os.path.join(docs_dir, path.lstrip('/')))
+        resolved = os.path.normpath(os.path.join(root, path.lstrip('/')))
     else:
         resolved = os.path.normpath(os.path.join(base_dir, path))
-    if os.path.commonpath([resolved, os.path.normpath(docs_dir)]) != os.path.normpath(docs_dir):
+    if resolved != root and not resolved.startswith(root.rstrip(os.sep) + os.sep):
         return None
     return resolved
 
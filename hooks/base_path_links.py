@@ -0,0 +1,40 @@
+"""MkDocs hook: prefix root-relative links with the site's base path.
+
+Pages link to other pages with root-relative URLs (``[Tools](/develop/tools/)``,
+``<a href="/develop/">``), and auto_index_table writes its table links the
+same way. Those only work when the site is served from the domain root. When
+it is served under a sub-path (see _base_path.py for where the path comes
+from), this hook rewrites every ``href``/``src`` attribute that starts with a
+single ``/`` in the rendered page:
+
+  <a href="/develop/tools/">  →  <a href="/polkadot-mkdocs/develop/tools/">
+
+The rewrite runs on the rendered HTML in memory, after every other
+on_page_content handler, so it also covers links that come from snippets
+(inserted while the Markdown is converted) and from INDEX TABLE blocks. Code
+samples are left alone, since their text is HTML-escaped by then.
+Protocol-relative (``//host``), relative and anchor links are never touched.
+
+The footer links need no rewriting: footer_nav stores page URLs relative to
+the site root, and the footer template passes them through the ``url``
+filter, which already accounts for where the site is served.
+
+With no base path (the default for https://docs.polkadot.com/) the hook does
+nothing.
+"""
+
+import re
+
+import _base_path
+from mkdocs.plugins import event_priority
+
+_ROOT_LINK_RE = re.compile(r"""(\s(?:href|src)\s*=\s*["'])/(?!/)""", re.IGNORECASE)
+
+
+@event_priority(-100)
+def on_page_content(html, *, page, config, **kwargs):
+    base = _base_path.base_path(config)
+    if not base:
+        return html
+    prefix = base + "/"
+    return _ROOT_LINK_RE.sub(lambda m: m.group(1) + prefix, html)
@@ -13,30 +13,66 @@ Items marked with footer_nav are:
   1. Given `meta = {'footer_nav': True}` so nav-item.html can skip them.
   2. Collected into config.extra['footer_nav'] (list of {title, url}) for
      use in the footer template, sorted by their position value.
+
+Section .nav.yml files are read through the shared graph in _nav_graph.py, and
+page front matter through the shared store in _frontmatter.py, which reads only
+the header of each file rather than the whole page. Since very few pages set
+footer_nav, each page is first byte-scanned for the key and only parsed if the
+scan finds it.
+
+Under `mkdocs serve` the extracted value of every page is remembered together
+with the file's signature (mtime, size), so a rebuild only re-examines pages
+that changed, and the footer list is only re-sorted when one of its entries
+actually changed.
+
+A section's directory and first page URL come from the shared nav index in
+_nav_index.py, computed once per nav rather than by walking each section.
+
+The footer is rendered on every page, so the final list is recorded as a
+global value in _page_deps.py: when it changes, a dirty rebuild re-renders
+every page (see page_dependencies).
 """
 
 import os
 
-import yaml
+import _frontmatter
+import _hook_state
+import _nav_graph
+import _nav_index
+import _page_deps
 from mkdocs.structure.nav import Section
 from mkdocs.structure.pages import Page
-from mkdocs.utils.meta import get_data
+
+# page path → (file signature, footer_nav value)
+_page_values = _hook_state.persistent("footer_nav.pages")
+# Unsorted entries and sorted footer list from the previous build.
+_previous = _hook_state.persistent("footer_nav.previous")
+
+
+def on_pre_build(config, **kwargs):
+    _nav_graph.graph.begin_build()
 
 
 def on_nav(nav, *, config, **kwargs):
     docs_dir = config["docs_dir"]
     footer_items = []
 
-    _process_items(nav.items, docs_dir, footer_items)
+    _process_items(nav.items, docs_dir, _nav_index.index_for(nav), footer_items)
 
-    # Stable sort: explicit integers first, then boolean `true` items in
-    # discovery order.  bool is a subclass of int in Python, so we check
-    # for bool before int.
-    footer_items.sort(key=lambda x: x.pop("_order"))
+    entries = [(x["title"], x["url"], x["_order"]) for x in footer_items]
+    if entries == _previous.get("entries"):
+        footer_items = [dict(x) for x in _previous["sorted"]]
+    else:
+        # Stable sort: explicit integers first, then boolean `true` items in
+        # discovery order.  bool is a subclass of int in Python, so we check
+        # for bool before int.
+        footer_items.sort(key=lambda x: x.pop("_order"))
+        _previous.update(entries=entries, sorted=[dict(x) for x in footer_items])
 
     if "extra" not in config or config["extra"] is None:
         config["extra"] = {}
     config["extra"]["footer_nav"] = footer_items
+    _page_deps.graph.record_global("footer_nav", footer_items)
 
     return nav
 
@@ -52,19 +88,17 @@ def _order_key(value):
     return value
 
 
-def _process_items(items, docs_dir, footer_items):
+def _process_items(items, docs_dir, index, footer_items):
     for item in items:
         if isinstance(item, Section):
-            section_dir = _get_section_dir(item, docs_dir)
-            if section_dir:
-                nav_yml_path = os.path.join(section_dir, ".nav.yml")
-                if os.path.exists(nav_yml_path):
-                    with open(nav_yml_path, encoding="utf-8") as f:
-                        data = yaml.safe_load(f) or {}
-                    fv = data.get("footer_nav")
+            section_dir = index.section_dir(item)
+            if section_dir is not None:
+                node = _nav_graph.graph.node(os.path.join(docs_dir, section_dir))
+                if node.exists:
+                    fv = node.get("footer_nav")
                     if fv:
                         item.meta = {"footer_nav": True}
-                        url = _get_first_page_url(item)
+                        url = index.first_page_url(item)
                         if url:
                             footer_items.append({
                                 "title": item.title,
@@ -72,40 +106,28 @@ def _process_items(items, docs_dir, footer_items):
                                 "_order": _order_key(fv),
                             })
                         continue  # don't recurse into footer sections
-            _process_items(item.children, docs_dir, footer_items)
+            _process_items(item.children, docs_dir, index, footer_items)
 
         elif isinstance(item, Page):
             if item.file and item.file.abs_src_path:
-                try:
-                    with open(item.file.abs_src_path, encoding="utf-8-sig") as f:
-                        content = f.read()
-                    _, meta = get_data(content)
-                    fv = meta.get("footer_nav")
-                    if fv:
-                        footer_items.append({
-                            "title": item.title,
-                            "url": item.url,
-                            "_order": _order_key(fv),
-                        })
-                except OSError:
-                    pass
-
-
-def _get_section_dir(section, docs_dir):
-    """Return the absolute directory of a section via its first direct Page child."""
-    for item in section.children:
-        if isinstance(item, Page) and item.file:
-            return os.path.join(docs_dir, os.path.dirname(item.file.src_path))
-    return None
-
-
-def _get_first_page_url(section):
-    """Return the URL of the first page anywhere in a section tree."""
-    for item in section.children:
-        if isinstance(item, Page) and item.url:
-            return item.url
-        if isinstance(item, Section):
-            url = _get_first_page_url(item)
-            if url:
-                return url
-    return None
\ No newline at end of file
+                fv = _page_footer_value(item.file.abs_src_path)
+                if fv:
+                    footer_items.append({
+                        "title": item.title,
+                        "url": item.url,
+                        "_order": _order_key(fv),
+                    })
+
+
+def _page_footer_value(path):
+    """Return a page's footer_nav value, re-reading the file only if it changed."""
+    signature = _frontmatter.file_signature(path)
+    record = _page_values.get(path)
+    if record is not None and record[0] == signature:
+        return record[1]
+
+    fv = None
+    if signature is not None and _frontmatter.header_contains(path, b"footer_nav"):
+        fv = _frontmatter.store.get(path).get("footer_nav")
+    _page_values[path] = (signature, fv)
+    return fv
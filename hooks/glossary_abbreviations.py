@@ -17,23 +17,99 @@ This hook:
   7. Processes only normal ``<p>`` paragraph text.
   8. Replaces matched text with ``<abbr title="...">Term</abbr>`` so the
      Material theme can display the tooltip.
+
+Terms are found with the Aho-Corasick matcher in ``_term_matcher.py``, so the
+cost of scanning a paragraph does not grow with the size of the glossary. A
+word-level prefilter runs over each page first: pages that cannot contain any
+term are returned untouched, and the rest are scanned with a matcher reduced
+to their candidate terms.
+
+The HTML is rewritten in a single streaming pass rather than through a parsed
+DOM: the rewriter tokenizes tags, tracks the open-element stack (paragraphs,
+skipped tags, ``grid cards`` containers) and only re-emits text nodes that
+actually contain a term. Every other byte of the page is passed through as-is.
+
+Annotated pages are cached on disk under ``.cache/glossary-tooltips/`` (next to
+``mkdocs.yml``; CI persists ``.cache`` between runs). Entries are addressed by
+a hash of the page HTML within a directory named after a hash of the term map
+and exclusions, so a warm build turns ``on_page_content`` into a file lookup
+and any glossary edit starts a fresh cache. After a build that rendered every
+page (anything but ``--dirty``), entries it did not use are deleted, so edited
+pages do not pile up stale entries. Set ``extra.glossary_tooltips.cache:
+false`` to disable the cache.
+
+By default annotation runs inline, page by page. With
+``extra.glossary_tooltips.mode: deferred`` the hook only marks each page's
+content region during ``on_page_content`` and annotates the written HTML files
+in ``on_post_build`` across a process pool (size set by
+``extra.glossary_tooltips.workers``, default: CPU count). The term map and
+matcher are built once and inherited by the forked workers. Each marked region
+is exactly the HTML inline mode would have annotated, so the result is
+byte-identical provided no plugin rewrites page HTML after ``on_page_content``
+(a plugin that strips comments removes the markers, which is reported as a
+warning). The search plugin indexes page content before it is annotated, so
+its index lacks the word breaks ``<abbr>`` tags add in inline mode; the
+indexed words are the same. The ``minify`` plugin with ``minify_html: true`` rewrites page HTML
+in ``on_post_page``, so the tooltips inserted later would not be minified;
+with it configured, deferred mode is refused with a warning and pages are
+annotated inline. Platforms without ``fork`` annotate the files serially, and
+so does ``mkdocs serve`` (or any build with other threads running), since
+forking a multi-threaded process is unsafe. A worker that dies without
+reporting fails the build rather than hanging it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import html
+import json
+import logging
+import multiprocessing
+import os
 import re
+import shutil
+import traceback
+from multiprocessing.connection import wait
 from pathlib import Path
-from typing import Pattern
 
-from bs4 import BeautifulSoup, NavigableString
+import _forking
+import _hook_state
+import _page_deps
+from _term_matcher import TermIndex, TermMatcher
+
+log = logging.getLogger("mkdocs")
+
+# Bump when the annotation output changes so stale cache entries are ignored.
+_CACHE_VERSION = "2"
+_CACHE_DIR = Path(".cache") / "glossary-tooltips"
+
+_DEFERRED_START = "<!--glossary-tooltips:start-->"
+_DEFERRED_END = "<!--glossary-tooltips:end-->"
+_DEFERRED_RE = re.compile(
+    re.escape(_DEFERRED_START) + r"(.*?)" + re.escape(_DEFERRED_END),
+    re.DOTALL,
+)
 
+# Same character references html.unescape() decodes, one match at a time.
+_CHARREF_RE = re.compile(r"&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)")
 _FRONT_MATTER_RE = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
 _HEADING_RE = re.compile(r"^(#{2,3})\s+(.+?)\s*$", re.MULTILINE)
 _INLINE_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)(?:\{[^}]*\})?")
 _REFERENCE_LINK_RE = re.compile(r"\[([^\]]+)\]\[[^\]]+\]")
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 _PAREN_RE = re.compile(r"^(?P<name>.+?)\s*\((?P<alias>[^)]+)\)$")
+_TOKEN_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<[!?][^>]*>"
+    r"|<(/?)([A-Za-z][^\s/>]*)((?:\"[^\"]*\"|'[^']*'|[^'\">])*)>",
+    re.DOTALL,
+)
+_CLASS_ATTR_RE = re.compile(r"""(?:^|\s)class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+_RAW_TEXT_TAGS = {"script", "style", "textarea", "title"}
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
 _SKIP_TAGS = {
     "a",
     "abbr",
@@ -52,40 +128,323 @@ _cache: dict[str, object] = {
     "path": None,
     "mtime": None,
     "terms": {},
-    "pattern": None,
+    "index": None,
+    "terms_key": None,
 }
 
+_stats = {"skipped": 0, "cached": 0, "computed": 0}
+
+# Written HTML files still to be annotated in deferred mode.
+_deferred_pages: list[str] = []
+# Whether this build uses deferred mode, decided in on_pre_build.
+_deferred = False
+# The command MkDocs runs ("build", "serve", ...) and its dirty flag, set once
+# per process in on_startup; hook globals do not survive serve rebuilds.
+_process = _hook_state.persistent("glossary_tooltips.process")
+# Digests of the cache entries this build read or wrote.
+_used_entries: set[str] = set()
+
+# (terms, index, cache_dir) for the current build; set before forking so
+# deferred-mode workers inherit it instead of rebuilding the matcher.
+_worker_state: tuple | None = None
 
-def on_page_content(content: str, *, config, **kwargs):
+
+def on_startup(command, dirty=False, **kwargs):
+    _process.update(command=command, dirty=dirty)
+
+
+def on_pre_build(config, **kwargs):
+    global _deferred
+    _stats.update(skipped=0, cached=0, computed=0)
+    _deferred_pages.clear()
+    _used_entries.clear()
+    _deferred = _use_deferred(config)
+
+
+def on_page_content(content: str, *, page, config, **kwargs):
+    # Every page is re-rendered when the glossary changes (see page_dependencies).
+    _page_deps.graph.record(page.file.abs_src_path, _glossary_path(config))
     excluded_terms = _excluded_terms(config)
-    terms, pattern = _load_terms(config, excluded_terms)
-    if not terms or pattern is None:
+    terms, index = _load_terms(config, excluded_terms)
+    if not terms or index is None:
         return content
 
-    soup = BeautifulSoup(content, "html.parser")
+    if _deferred:
+        if not _page_candidates(content, index):
+            _stats["skipped"] += 1
+            return content
+        _deferred_pages.append(page.file.abs_dest_path)
+        return f"{_DEFERRED_START}{content}{_DEFERRED_END}"
+
+    annotated, outcome = _annotate_cached(content, terms, index, _page_cache_dir(config))
+    _stats[outcome] += 1
+    return annotated
+
+
+def on_post_build(config, **kwargs):
+    if _deferred_pages:
+        _annotate_deferred(config)
+
+    # A dirty build only renders some pages, so it cannot tell which entries
+    # are stale.
+    if not _process.get("dirty"):
+        cache_dir = _page_cache_dir(config)
+        if cache_dir is not None:
+            _prune_cache(cache_dir)
+
+    total = sum(_stats.values())
+    if total:
+        log.info(
+            f"glossary_tooltips: {_stats['skipped']} of {total} pages "
+            f"({100 * _stats['skipped'] / total:.0f}%) had no candidate terms, "
+            f"{_stats['cached']} served from cache, {_stats['computed']} recomputed"
+        )
+
+
+def _tooltip_config(config) -> dict:
+    return config.get("extra", {}).get("glossary_tooltips", {}) or {}
+
+
+def _use_deferred(config) -> bool:
+    if _tooltip_config(config).get("mode") != "deferred":
+        return False
+    minifier = _html_minifier(config)
+    if minifier is not None:
+        log.warning(
+            f"glossary_tooltips: mode: deferred is not compatible with minify_html in the "
+            f"'{minifier}' plugin (page HTML is minified before the tooltips would be "
+            "added) — annotating pages inline instead"
+        )
+        return False
+    return True
+
+
+def _html_minifier(config) -> str | None:
+    """Return the name of a configured plugin that minifies page HTML, if any."""
+    plugins = config.get("plugins") or {}
+    for name, plugin in plugins.items():
+        if name.split("/")[-1] != "minify":
+            continue
+        options = getattr(plugin, "config", None) or {}
+        if options.get("minify_html"):
+            return name
+    return None
 
-    for paragraph in soup.find_all("p"):
-        if _inside_grid_cards(paragraph):
+
+def _page_candidates(content: str, index: TermIndex) -> frozenset[str]:
+    return index.candidates(html.unescape(content) if "&" in content else content)
+
+
+def _annotate_cached(
+    content: str,
+    terms: dict[str, str],
+    index: TermIndex,
+    cache_dir: Path | None,
+) -> tuple[str, str]:
+    """Return ``(annotated content, outcome)``.
+
+    outcome is "skipped" (no candidate terms), "cached" or "computed".
+    """
+    candidates = _page_candidates(content, index)
+    if not candidates:
+        return content, "skipped"
+
+    if cache_dir is None:
+        return _annotate_html(content, terms, index.matcher_for(candidates)), "computed"
+
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    cache_path = cache_dir / digest[:2] / f"{digest}.html"
+    _used_entries.add(digest)
+    try:
+        cached = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        cached = None
+    if cached is not None:
+        # An empty entry means the page had nothing to annotate.
+        return cached or content, "cached"
+
+    # Only build (or look up) a matcher on a miss; warm builds never need one.
+    annotated = _annotate_html(content, terms, index.matcher_for(candidates))
+    _write_cache_entry(cache_path, "" if annotated == content else annotated)
+    return annotated, "computed"
+
+
+def _annotate_deferred(config) -> None:
+    global _worker_state
+    terms, index = _load_terms(config, _excluded_terms(config))
+    _worker_state = (terms, index, _page_cache_dir(config))
+
+    pages = sorted(set(_deferred_pages))
+    workers = _tooltip_config(config).get("workers") or os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(pages)))
+    chunks = [pages[i::workers] for i in range(workers)]
+
+    try:
+        if workers > 1 and _forking.can_fork(_process.get("command")):
+            results = _run_forked(chunks)
+        else:
+            results = [_annotate_files(pages)]
+    finally:
+        _worker_state = None
+
+    for counts, unmarked, used in results:
+        _used_entries.update(used)
+        for outcome, count in counts.items():
+            _stats[outcome] += count
+        for path in unmarked:
+            log.warning(
+                f"glossary_tooltips: no deferred-mode markers found in {path} — "
+                "a later plugin removed them, page left without tooltips"
+            )
+
+
+def _run_forked(chunks: list[list[str]]) -> list[tuple[dict[str, int], list[str], set[str]]]:
+    """Annotate each chunk of files in its own forked process.
+
+    Forked workers share the parent's ``_worker_state`` and are started with
+    plain ``Process`` objects, so nothing from this hook module has to be
+    pickled (MkDocs loads hooks under a file-path name that cannot be
+    re-imported by name). Each worker reports over its own pipe; a worker
+    that dies before reporting closes the pipe, which fails the build
+    instead of waiting forever.
+    """
+    context = multiprocessing.get_context("fork")
+    pending = {}
+    for chunk in chunks:
+        reader, writer = context.Pipe(duplex=False)
+        worker = context.Process(target=_annotate_worker, args=(chunk, writer), daemon=True)
+        worker.start()
+        writer.close()
+        pending[reader] = worker
+
+    results = []
+    try:
+        while pending:
+            for reader in wait(list(pending)):
+                worker = pending.pop(reader)
+                try:
+                    ok, value = reader.recv()
+                except EOFError:
+                    worker.join()
+                    raise RuntimeError(
+                        f"glossary_tooltips: deferred annotation worker {worker.pid} exited "
+                        f"with code {worker.exitcode} before reporting its results"
+                    ) from None
+                finally:
+                    reader.close()
+                worker.join()
+                if not ok:
+                    raise RuntimeError(f"glossary_tooltips: deferred annotation worker failed:\n{value}")
+                results.append(value)
+    finally:
+        for worker in pending.values():
+            worker.terminate()
+        for reader, worker in pending.items():
+            reader.close()
+            worker.join()
+    return results
+
+
+def _annotate_worker(paths: list[str], conn) -> None:
+    try:
+        result = (True, _annotate_files(paths))
+    except BaseException:
+        result = (False, traceback.format_exc())
+    conn.send(result)
+    conn.close()
+
+
+def _annotate_files(paths: list[str]) -> tuple[dict[str, int], list[str], set[str]]:
+    """Annotate the marked regions of written HTML files (runs in a worker)."""
+    assert _worker_state is not None
+    terms, index, cache_dir = _worker_state
+    counts = {"skipped": 0, "cached": 0, "computed": 0}
+    unmarked = []
+
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8", newline="") as f:
+                output = f.read()
+        except OSError:
             continue
 
-        for text_node in list(paragraph.find_all(string=True)):
-            if not isinstance(text_node, NavigableString):
-                continue
-            if _has_skipped_parent(text_node, paragraph):
+        def replace(match):
+            annotated, outcome = _annotate_cached(match.group(1), terms, index, cache_dir)
+            counts[outcome] += 1
+            return annotated
+
+        rewritten, count = _DEFERRED_RE.subn(replace, output)
+        if not count:
+            unmarked.append(path)
+            continue
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(rewritten)
+
+    # In a forked worker, _used_entries is the worker's own copy.
+    return counts, unmarked, _used_entries
+
+
+def _page_cache_dir(config) -> Path | None:
+    """Return the cache directory for the current term map, or None if disabled."""
+    if _tooltip_config(config).get("cache", True) is False or not _cache["terms_key"]:
+        return None
+
+    root = Path(os.path.dirname(config.config_file_path or "")) / _CACHE_DIR
+    cache_dir = root / str(_cache["terms_key"])
+    if not cache_dir.is_dir():
+        # The term map changed: drop entries built from older glossaries.
+        if root.is_dir():
+            for stale in root.iterdir():
+                shutil.rmtree(stale, ignore_errors=True)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            log.warning(f"glossary_tooltips: cannot create cache directory {cache_dir}: {e}")
+            return None
+    return cache_dir
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete the entries (and leftover temp files) this build did not use."""
+    removed = 0
+    for bucket in cache_dir.iterdir():
+        if not bucket.is_dir():
+            continue
+        for entry in bucket.iterdir():
+            if entry.name.split(".", 1)[0] in _used_entries and entry.suffix == ".html":
                 continue
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        try:
+            bucket.rmdir()
+        except OSError:
+            pass  # still holds entries in use
+    if removed:
+        log.debug(f"glossary_tooltips: removed {removed} unused cache entries")
+
+
+def _write_cache_entry(path: Path, value: str) -> None:
+    try:
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(value, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug(f"glossary_tooltips: could not write cache entry {path}: {e}")
 
-            replacement = _tooltip_nodes(soup, str(text_node), terms, pattern)
-            if replacement:
-                text_node.replace_with(*replacement)
 
-    return str(soup)
+def _glossary_path(config) -> Path:
+    return Path(config["docs_dir"]) / "reference" / "glossary.md"
 
 
 def _load_terms(
     config,
     excluded_terms: frozenset[str],
-) -> tuple[dict[str, str], Pattern[str] | None]:
-    glossary_path = Path(config["docs_dir"]) / "reference" / "glossary.md"
+) -> tuple[dict[str, str], TermIndex | None]:
+    glossary_path = _glossary_path(config)
 
     try:
         mtime = glossary_path.stat().st_mtime
@@ -97,7 +456,7 @@ def _load_terms(
         and _cache["mtime"] == mtime
         and _cache.get("excluded_terms") == excluded_terms
     ):
-        return dict(_cache["terms"]), _cache["pattern"]  # type: ignore[return-value]
+        return _cache["terms"], _cache["index"]  # type: ignore[return-value]
 
     try:
         glossary = glossary_path.read_text(encoding="utf-8")
@@ -105,15 +464,24 @@ def _load_terms(
         return {}, None
 
     terms = _exclude_terms(_build_terms(glossary), excluded_terms)
-    pattern = _build_pattern(terms)
+    index = _build_index(terms)
     _cache.update({
         "path": glossary_path,
         "mtime": mtime,
         "excluded_terms": excluded_terms,
         "terms": terms,
-        "pattern": pattern,
+        "index": index,
+        "terms_key": _terms_key(terms, excluded_terms),
     })
-    return terms, pattern
+    return terms, index
+
+
+def _terms_key(terms: dict[str, str], excluded_terms: frozenset[str]) -> str:
+    payload = json.dumps(
+        [_CACHE_VERSION, terms, sorted(excluded_terms)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 
 def _build_terms(markdown: str) -> dict[str, str]:
@@ -141,12 +509,11 @@ def _build_terms(markdown: str) -> dict[str, str]:
     ))
 
 
-def _build_pattern(terms: dict[str, str]) -> Pattern[str] | None:
+def _build_index(terms: dict[str, str]) -> TermIndex | None:
     if not terms:
         return None
 
-    alternatives = "|".join(re.escape(term) for term in terms)
-    return re.compile(rf"(?<![\w-])({alternatives})(?![\w-])")
+    return TermIndex(terms)
 
 
 def _excluded_terms(config) -> frozenset[str]:
@@ -207,46 +574,146 @@ def _plain_text(value: str) -> str:
     return html.unescape(value)
 
 
-def _has_skipped_parent(text_node: NavigableString, paragraph) -> bool:
-    parent = text_node.parent
-    while parent is not None and parent is not paragraph:
-        if getattr(parent, "name", None) in _SKIP_TAGS:
-            return True
-        parent = parent.parent
-    return False
-
+def _annotate_html(
+    content: str,
+    terms: dict[str, str],
+    matcher: TermMatcher,
+) -> str:
+    """Add tooltips to eligible paragraph text in ``content``.
+
+    Text is eligible when it sits inside a ``<p>`` that has no ``grid cards``
+    ancestor, with no ``_SKIP_TAGS`` element between the text and that
+    paragraph. Bytes outside rewritten text nodes are copied unchanged.
+    """
+    out: list[str] = []
+    stack: list[str] = []
+    # Stack indices of open <p>, skipped and grid-cards elements.
+    paragraphs: list[int] = []
+    skipped: list[int] = []
+    grids: list[int] = []
+    pos = 0
+    size = len(content)
+
+    while pos < size:
+        match = _TOKEN_RE.search(content, pos)
+        end = match.start() if match else size
+
+        if end > pos:
+            text = content[pos:end]
+            if (
+                paragraphs
+                and (not skipped or skipped[-1] < paragraphs[-1])
+                and (not grids or grids[0] > paragraphs[-1])
+            ):
+                text = _tooltip_text(text, terms, matcher)
+            out.append(text)
+        if match is None:
+            break
+
+        out.append(match.group(0))
+        pos = match.end()
+        name = match.group(2)
+        if name is None:
+            continue  # comment, doctype or processing instruction
+        name = name.lower()
+
+        if match.group(1):
+            if name in stack:
+                depth = len(stack) - 1 - stack[::-1].index(name)
+                del stack[depth:]
+                for indices in (paragraphs, skipped, grids):
+                    while indices and indices[-1] >= depth:
+                        indices.pop()
+            continue
 
-def _inside_grid_cards(tag) -> bool:
-    for parent in tag.parents:
-        classes = parent.get("class", [])
-        if "grid" in classes and "cards" in classes:
-            return True
-    return False
+        if name in _RAW_TEXT_TAGS:
+            close = re.compile(rf"</{name}\s*>", re.IGNORECASE).search(content, pos)
+            raw_end = close.end() if close else size
+            out.append(content[pos:raw_end])
+            pos = raw_end
+            continue
 
+        attrs = match.group(3)
+        if name in _VOID_TAGS or attrs.rstrip().endswith("/"):
+            continue
 
-def _tooltip_nodes(
-    soup: BeautifulSoup,
-    text: str,
-    terms: dict[str, str],
-    pattern: Pattern[str],
-):
-    nodes = []
-    last_end = 0
+        index = len(stack)
+        stack.append(name)
+        if name == "p":
+            paragraphs.append(index)
+        if name in _SKIP_TAGS:
+            skipped.append(index)
+        if "class" in attrs.lower() and _has_grid_cards_class(attrs):
+            grids.append(index)
 
-    for match in pattern.finditer(text):
-        if match.start() > last_end:
-            nodes.append(NavigableString(text[last_end:match.start()]))
+    return "".join(out)
 
-        term = match.group(0)
-        abbr = soup.new_tag("abbr", title=terms[term])
-        abbr.string = term
-        nodes.append(abbr)
-        last_end = match.end()
 
-    if not nodes:
-        return []
+def _has_grid_cards_class(attrs: str) -> bool:
+    match = _CLASS_ATTR_RE.search(attrs)
+    if not match:
+        return False
+    classes = html.unescape(next(g for g in match.groups() if g is not None)).split()
+    return "grid" in classes and "cards" in classes
 
-    if last_end < len(text):
-        nodes.append(NavigableString(text[last_end:]))
 
-    return nodes
+def _tooltip_text(
+    raw: str,
+    terms: dict[str, str],
+    matcher: TermMatcher,
+) -> str:
+    """Return ``raw`` HTML text with glossary terms wrapped in ``<abbr>``.
+
+    Terms are matched in the decoded text, but only the ``<abbr>`` tags are
+    inserted: every byte of ``raw``, character references included, is kept.
+    """
+    text = html.unescape(raw) if "&" in raw else raw
+    matches = list(matcher.finditer(text))
+    if not matches:
+        return raw
+    # Offsets only differ when a character reference was decoded.
+    offsets = _raw_offsets(raw) if text is not raw else None
+
+    parts: list[str] = []
+    last_end = 0
+    for start, end in matches:
+        raw_start, raw_end = (start, end) if offsets is None else (offsets.get(start), offsets.get(end))
+        if raw_start is None or raw_end is None:
+            continue  # the match starts or ends inside a character reference
+        parts.append(raw[last_end:raw_start])
+        parts.append(f"<abbr title={_quote_attr(terms[text[start:end]])}>{raw[raw_start:raw_end]}</abbr>")
+        last_end = raw_end
+
+    if not parts:
+        return raw
+    parts.append(raw[last_end:])
+    return "".join(parts)
+
+
+def _raw_offsets(raw: str) -> dict[int, int]:
+    """Map offsets in ``html.unescape(raw)`` back to offsets in ``raw``.
+
+    Every character boundary that exists in both strings is mapped; positions
+    inside a character reference's expansion are absent.
+    """
+    offsets: dict[int, int] = {}
+    text_pos = 0
+    raw_pos = 0
+    for match in _CHARREF_RE.finditer(raw):
+        for i in range(match.start() - raw_pos + 1):
+            offsets[text_pos + i] = raw_pos + i
+        text_pos += match.start() - raw_pos + len(html.unescape(match.group(0)))
+        raw_pos = match.end()
+    for i in range(len(raw) - raw_pos + 1):
+        offsets[text_pos + i] = raw_pos + i
+    return offsets
+
+
+def _quote_attr(value: str) -> str:
+    """Escape and quote an attribute value, preferring whichever quote it lacks."""
+    value = html.escape(value, quote=False)
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return '"' + value.replace('"', "&quot;") + '"'
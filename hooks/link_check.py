@@ -0,0 +1,226 @@
+"""MkDocs hook: check internal links and redirect targets against the built site.
+
+mkdocs.yml sets ``validation`` to ``ignore`` for absolute and unrecognized
+links, so MkDocs itself does not catch broken internal links. This hook does,
+after the build, by looking at what was actually written to site_dir:
+
+  1. Every file in site_dir becomes a known URL (``a/b/index.html`` also
+     answers to ``/a/b/``).
+  2. Every HTML page is scanned (in a process pool, or in-process under
+     ``mkdocs serve``; see _link_scan.py) for its element ids, the anchors
+     that toc permalinks and in-page links point at, and for its
+     ``<a href>`` values.
+  3. Each internal href is resolved against its page and checked: the target
+     must exist and, if the link has a #fragment, the target page must have
+     an element with that id. Each redirects.json value is checked the same way.
+
+External links (with a scheme or ``//host``) are not checked.
+
+The result is written as JSON (default ``.cache/link-check/report.json`` next
+to mkdocs.yml):
+
+  {"summary": {"pages": 412, "links": 9031, "broken_links": 2, ...},
+   "broken_links": [{"page": "/develop/", "href": "../tool/#usage",
+                     "target": "/tool/", "fragment": "usage",
+                     "reason": "missing page"}, ...],
+   "broken_redirects": [{"key": "/old/", "value": "/gone/", "reason": ...}]}
+
+The check is opt-in, since it adds a few seconds to every build:
+
+  extra:
+    link_check:
+      enabled: true        # or set MKDOCS_LINK_CHECK=1
+      report: .cache/link-check/report.json
+      workers: 4           # default: CPU count
+      strict: false        # true → fail the build on broken links
+
+Redirect targets are read from the same file as redirect_stubs
+(``extra.redirects.file``, default redirects.json).
+"""
+
+import json
+import logging
+import os
+import posixpath
+import time
+from urllib.parse import unquote, urljoin, urlsplit
+
+import _base_path
+import _hook_state
+import _link_scan
+from mkdocs.exceptions import PluginError
+
+log = logging.getLogger("mkdocs")
+
+TODO_VALUE = "TODO: UPDATE_ME"
+DEFAULT_REPORT = os.path.join(".cache", "link-check", "report.json")
+MAX_LOGGED = 20
+
+# Set once per process in on_startup; hook globals do not survive serve rebuilds.
+_state = _hook_state.persistent("link_check")
+
+
+def on_startup(command, **kwargs):
+    _state["command"] = command
+
+
+def on_post_build(config, **kwargs):
+    options = _options(config)
+    if not (options.get("enabled") or os.environ.get("MKDOCS_LINK_CHECK", "") not in ("", "0")):
+        return
+
+    start = time.monotonic()
+    site_dir = config["site_dir"]
+    base = _base_path.base_path(config)
+
+    urls, pages = _site_map(site_dir)
+    scanned = _link_scan.scan_files(list(pages.values()), options.get("workers"), _state.get("command"))
+    anchors = {url: scanned[path][0] for url, path in pages.items()}
+
+    redirects = _redirects(config)
+    # Redirect stubs are reported once, under broken_redirects.
+    redirect_keys = {key for key, _ in redirects}
+
+    broken_links = []
+    link_count = 0
+    for url, path in pages.items():
+        if url in redirect_keys:
+            continue
+        for href in scanned[path][1]:
+            target = _internal_target(url, href, base)
+            if target is None:
+                continue
+            link_count += 1
+            problem = _check(target, urls, anchors)
+            if problem:
+                broken_links.append({"page": url, "href": href, **problem})
+
+    broken_redirects = []
+    for key, value in redirects:
+        if value == TODO_VALUE:
+            broken_redirects.append({"key": key, "value": value, "reason": "placeholder value"})
+            continue
+        if urlsplit(value).scheme:
+            continue
+        problem = _check(_split_target(value), urls, anchors)
+        if problem:
+            broken_redirects.append({"key": key, "value": value, "reason": problem["reason"]})
+
+    summary = {
+        "pages": len(pages),
+        "links": link_count,
+        "broken_links": len(broken_links),
+        "broken_redirects": len(broken_redirects),
+        "seconds": round(time.monotonic() - start, 3),
+    }
+    report_path = os.path.join(
+        os.path.dirname(config.config_file_path or ""), options.get("report", DEFAULT_REPORT)
+    )
+    _write_report(report_path, {
+        "summary": summary,
+        "broken_links": broken_links,
+        "broken_redirects": broken_redirects,
+    })
+
+    for item in broken_links[:MAX_LOGGED]:
+        log.warning(f"link check: {item['page']}: {item['href']} → {item['reason']}")
+    for item in broken_redirects[:MAX_LOGGED]:
+        log.warning(f"link check: redirect {item['key']} → {item['value']}: {item['reason']}")
+    log.info(
+        f"link check: {summary['links']} links on {summary['pages']} pages, "
+        f"{summary['broken_links']} broken, {summary['broken_redirects']} broken redirects "
+        f"in {summary['seconds']:.2f}s; report: {report_path}"
+    )
+
+    if options.get("strict") and (broken_links or broken_redirects):
+        raise PluginError(
+            f"link check: {len(broken_links)} broken links and {len(broken_redirects)} "
+            f"broken redirects, see {report_path}"
+        )
+
+
+def _options(config):
+    extra = config.get("extra") or {}
+    return extra.get("link_check") or {}
+
+
+def _site_map(site_dir):
+    """Return (set of every served URL, {page URL: HTML path})."""
+    urls = set()
+    pages = {}
+    for root, _, filenames in os.walk(site_dir):
+        rel_root = os.path.relpath(root, site_dir).replace(os.sep, "/")
+        prefix = "/" if rel_root == "." else f"/{rel_root}/"
+        for name in filenames:
+            url = prefix + name
+            urls.add(url)
+            if name == "index.html":
+                url = prefix
+                urls.add(prefix)
+                urls.add(prefix.rstrip("/") or "/")
+            if name.endswith(".html"):
+                pages[url] = os.path.join(root, name)
+    return urls, pages
+
+
+def _internal_target(page_url, href, base):
+    """Return (site path, fragment) for an internal href, or None to skip it."""
+    if not href or href.startswith("//"):
+        return None
+    parts = urlsplit(href)
+    if parts.scheme:
+        return None
+    if not parts.path:
+        # "#fragment" or "?query" on the current page
+        return page_url, unquote(parts.fragment)
+
+    path = urljoin(base + page_url, parts.path)
+    if base:
+        if path != base and not path.startswith(base + "/"):
+            return None  # outside the site
+        path = path[len(base):] or "/"
+    # urljoin keeps ".." segments that climb above the root
+    path = posixpath.normpath(path) + ("/" if path.endswith("/") and path != "/" else "")
+    return unquote(path), unquote(parts.fragment)
+
+
+def _split_target(value):
+    parts = urlsplit(value)
+    return unquote(parts.path), unquote(parts.fragment)
+
+
+def _check(target, urls, anchors):
+    path, fragment = target
+    if path not in urls:
+        return {"target": path, "fragment": fragment, "reason": "missing page"}
+    if fragment:
+        page = path
+        if page.endswith("/index.html"):
+            page = page[:-len("index.html")]
+        elif page not in anchors:
+            page = page.rstrip("/") + "/"
+        ids = anchors.get(page)
+        if ids is not None and fragment not in ids:
+            return {"target": path, "fragment": fragment, "reason": "missing anchor"}
+    return None
+
+
+def _redirects(config):
+    extra = config.get("extra") or {}
+    redirect_options = extra.get("redirects") or {}
+    path = os.path.join(
+        os.path.dirname(config.config_file_path or ""), redirect_options.get("file", "redirects.json")
+    )
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f).get("data", [])
+    except (OSError, ValueError):
+        return []
+    return [(entry["key"], entry["value"]) for entry in data]
+
+
+def _write_report(path, report):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
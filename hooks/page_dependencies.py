@@ -0,0 +1,128 @@
+"""MkDocs hook: re-render pages whose inputs changed during dirty rebuilds.
+
+With ``--dirty`` (``mkdocs serve --dirty``, ``mkdocs build --dirty``) MkDocs
+only re-renders pages whose own source is newer than their built HTML. Several
+hooks render one page from other files, which that check cannot see:
+
+  auto_index_table       index pages ← listed pages' frontmatter, .nav.yml
+                         files and directory listings
+  glossary_abbreviations every page ← reference/glossary.md
+  synthesize_ancestors   orphan pages ← .nav.yml titles of the synthetic
+                         breadcrumb levels
+  footer_nav             every page ← the footer list (a global value)
+
+Those hooks record what they read in the shared graph (_page_deps.py). On the
+next dirty build, after every other on_nav handler, this hook asks the graph
+which pages have a changed dependency and deletes their built HTML, so MkDocs
+treats them as modified and renders them again. Every other page is left as
+it is, so editing the glossary re-renders all pages while editing one page's
+frontmatter re-renders that page and the index pages listing it. If a global
+value changed or no previous graph is known, every page is re-rendered.
+
+Under ``mkdocs serve`` the graph lives in memory; ``mkdocs build`` saves it to
+``.cache/page-deps/`` (next to mkdocs.yml) for the next ``build --dirty``.
+Dependencies outside docs_dir, which the dev server does not watch by itself,
+are registered with its watcher. Clean builds only record the graph.
+"""
+
+import hashlib
+import logging
+import os
+
+import _hook_state
+import _page_deps
+from mkdocs.plugins import event_priority
+
+log = logging.getLogger("mkdocs")
+
+CACHE_DIR = os.path.join(".cache", "page-deps")
+
+# Set once per process in on_startup; hook globals do not survive serve rebuilds.
+_state = _hook_state.persistent("page_dependencies")
+
+
+def on_startup(command, dirty, **kwargs):
+    _state.update(command=command, dirty=dirty, server=None, watched=set())
+
+
+def on_serve(server, config, builder, **kwargs):
+    _state["server"] = server
+    _watch_new(config)
+    return server
+
+
+# Before any other hook records a global value for this build.
+@event_priority(100)
+def on_pre_build(config, **kwargs):
+    _page_deps.graph.begin_build()
+
+
+# After every other on_nav handler (footer_nav records its global there) and
+# before MkDocs decides which pages are modified.
+@event_priority(-100)
+def on_nav(nav, *, config, files, **kwargs):
+    if not _state.get("dirty"):
+        return nav
+
+    graph = _page_deps.graph
+    if not graph.known and _state.get("command") == "build":
+        graph.load(_cache_path(config))
+
+    pages = {os.path.normpath(f.abs_src_path): f for f in files.documentation_pages()}
+    graph.prune(pages)
+    stale = graph.stale_pages()
+    if stale is None:
+        stale = set(pages)
+        log.debug("page dependencies: no usable graph from a previous build, re-rendering every page")
+
+    removed = 0
+    for path in stale:
+        file = pages.get(path)
+        if file is None:
+            continue
+        try:
+            os.remove(file.abs_dest_path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    if removed:
+        log.info(f"page dependencies: re-rendering {removed} page(s) with changed dependencies")
+    return nav
+
+
+def on_pre_page(page, **kwargs):
+    # The hooks record this page's dependencies afresh while it is rendered.
+    if page.file.abs_src_path:
+        _page_deps.graph.reset(page.file.abs_src_path)
+    return page
+
+
+def on_post_build(config, **kwargs):
+    graph = _page_deps.graph
+    graph.end_build()
+    if _state.get("command") == "build":
+        graph.save(_cache_path(config))
+    if _state.get("server") is not None:
+        _watch_new(config)
+    stats = graph.stats()
+    log.debug(
+        f"page dependencies: {stats['edges']} edges from {stats['pages']} pages "
+        f"to {stats['dependencies']} files"
+    )
+
+
+def _watch_new(config):
+    """Watch recorded dependencies that live outside docs_dir."""
+    docs_dir = os.path.normpath(config["docs_dir"]) + os.sep
+    watched = _state["watched"]
+    for path in sorted(_page_deps.graph.dependencies()):
+        if path.startswith(docs_dir) or path in watched or not os.path.exists(path):
+            continue
+        watched.add(path)
+        _state["server"].watch(path)
+
+
+def _cache_path(config):
+    """One graph per site_dir, since a dirty build compares against what is there."""
+    key = hashlib.sha256(os.path.abspath(config["site_dir"]).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(os.path.dirname(config.config_file_path or ""), CACHE_DIR, f"{key}.json")
@@ -0,0 +1,289 @@
+"""MkDocs hook: compile redirects.json into static redirect stubs and an nginx map.
+
+redirects.json (maintained by scripts/update_redirects.py) maps old page paths
+to their new location:
+
+  {"data": [{"key": "/old/page/", "value": "/new/page/"}, ...]}
+
+For every entry this hook writes a small HTML page at the old path
+(``site_dir/old/page/index.html``) that redirects to the new one. When
+``nginx_map`` is set it also writes an nginx ``map`` include, so the server
+can answer with a 301 directly instead of serving the stub. The map is written
+outside site_dir (it is server configuration, not part of the site):
+
+  # nginx.conf
+  include /var/www/polkadot-docs-redirects.map;
+  server {
+      ...
+      if ($redirect_target) { return 301 $redirect_target; }
+  }
+
+The redirects are validated as soon as the final Files collection is known
+(on_nav), before any page is rendered. The build fails if an entry still has
+the ``TODO: UPDATE_ME`` placeholder, points at a page that is not in the
+docs, or redirects away from a path that is a page again (the entry would
+overwrite it; remove it from redirects.json). Targets with a URL scheme
+(external links) are not checked.
+
+Writing is incremental: a manifest records the hash of every stub. A stub is
+only rewritten when its entry changed or the file is missing (e.g. after a
+clean build). Stubs for entries that were removed from redirects.json are
+deleted. The nginx map is only rewritten when its content changes. ``mkdocs
+build`` keeps one manifest per site_dir under .cache/redirect-stubs/ (next to
+mkdocs.yml); ``mkdocs serve`` builds into a temporary directory that is gone
+when it exits, so it keeps the manifest in memory instead.
+
+Options (all optional) under ``extra.redirects`` in mkdocs.yml:
+
+  extra:
+    redirects:
+      file: redirects.json     # relative to mkdocs.yml
+      nginx_map: /var/www/polkadot-docs-redirects.map
+                               # relative to mkdocs.yml; not written if unset
+      enabled: true
+"""
+
+import hashlib
+import html
+import json
+import logging
+import os
+from urllib.parse import unquote, urlsplit
+
+import _base_path
+import _hook_state
+from mkdocs.exceptions import PluginError
+
+log = logging.getLogger("mkdocs")
+
+TODO_VALUE = "TODO: UPDATE_ME"
+MANIFEST_DIR = os.path.join(".cache", "redirect-stubs")
+
+_STUB_TEMPLATE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Redirecting...</title>
+<link rel="canonical" href="{canonical}">
+<meta name="robots" content="noindex">
+<script>var anchor=window.location.hash.substr(1);location.href="{target_js}"+(anchor?"#"+anchor:"")</script>
+<meta http-equiv="refresh" content="0; url={target}">
+</head>
+<body>
+Redirecting to <a href="{target}">{target}</a>...
+</body>
+</html>
+"""
+
+_redirects = None
+
+# Set once per process in on_startup; hook globals do not survive serve rebuilds.
+_state = _hook_state.persistent("redirect_stubs")
+
+
+def on_startup(command, **kwargs):
+    _state.update(command=command, manifest={})
+
+
+def on_pre_build(config, **kwargs):
+    global _redirects
+    _redirects = None
+
+
+def on_nav(nav, *, config, files, **kwargs):
+    global _redirects
+    options = _options(config)
+    if not options.get("enabled", True):
+        return nav
+
+    path = os.path.join(os.path.dirname(config.config_file_path), options.get("file", "redirects.json"))
+    if not os.path.isfile(path):
+        log.debug(f"redirect stubs: {path} not found, nothing to do")
+        return nav
+
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f).get("data", [])
+
+    redirects = {}
+    for entry in entries:
+        redirects.setdefault(entry["key"], entry["value"])
+
+    site_urls = _site_urls(files)
+    _validate(redirects, site_urls)
+    _redirects = redirects
+    return nav
+
+
+def on_post_build(config, **kwargs):
+    if _redirects is None:
+        return
+
+    options = _options(config)
+    site_dir = config["site_dir"]
+    base = _base_path.base_path(config)
+
+    written, removed = _write_stubs(config, site_dir, base)
+
+    nginx_map = options.get("nginx_map")
+    if nginx_map:
+        path = os.path.join(os.path.dirname(config.config_file_path or ""), nginx_map)
+        _write_if_changed(path, _nginx_map(base))
+
+    log.info(
+        f"redirect stubs: {len(_redirects)} redirects, "
+        f"{written} stubs written, {removed} removed"
+    )
+
+
+def _options(config):
+    extra = config.get("extra") or {}
+    return extra.get("redirects") or {}
+
+
+def _site_urls(files):
+    """Return every root-relative URL the build produces, e.g. "/develop/"."""
+    urls = set()
+    for file in files:
+        if file.inclusion.is_excluded():
+            continue
+        urls.add("/" + unquote(file.url))
+    return urls
+
+
+def _validate(redirects, site_urls):
+    todo = sorted(key for key, value in redirects.items() if value == TODO_VALUE)
+    pages = sorted(redirects.keys() & site_urls)
+    missing = []
+    for key, value in sorted(redirects.items()):
+        if value == TODO_VALUE or urlsplit(value).scheme:
+            continue
+        target = urlsplit(value).path
+        if target not in site_urls and target.rstrip("/") + "/" not in site_urls:
+            missing.append(f"{key} → {value}")
+
+    errors = []
+    if todo:
+        errors.append(f"{len(todo)} redirect(s) still set to '{TODO_VALUE}':\n  " + "\n  ".join(todo))
+    if missing:
+        errors.append(f"{len(missing)} redirect(s) point at pages that do not exist:\n  " + "\n  ".join(missing))
+    if pages:
+        errors.append(
+            f"{len(pages)} redirect(s) start from a path that is a page again "
+            "(remove them from redirects.json):\n  " + "\n  ".join(pages)
+        )
+    if errors:
+        raise PluginError("redirects.json is not ready to deploy. " + "\n".join(errors))
+
+
+def _stub_path(site_dir, key):
+    rel = key.strip("/")
+    if not rel or key.endswith("/"):
+        rel = os.path.join(rel, "index.html")
+    return os.path.join(site_dir, *rel.split("/"))
+
+
+def _target_url(base, value):
+    if urlsplit(value).scheme:
+        return value
+    return base + value
+
+
+def _render_stub(config, base, value):
+    target = _target_url(base, value)
+    canonical = target
+    site_url = config.get("site_url")
+    if site_url and not urlsplit(target).scheme:
+        canonical = site_url.rstrip("/") + "/" + value.lstrip("/")
+    return _STUB_TEMPLATE.format(
+        canonical=html.escape(canonical),
+        target=html.escape(target),
+        target_js=json.dumps(target)[1:-1].replace("</", "<\\/"),
+    )
+
+
+def _write_stubs(config, site_dir, base):
+    """Write changed stubs and delete stale ones; returns (written, removed)."""
+    manifest_path = None
+    if _state.get("command") == "serve":
+        previous = _state["manifest"]
+    else:
+        manifest_path = os.path.join(
+            os.path.dirname(config.config_file_path or ""),
+            MANIFEST_DIR,
+            hashlib.sha256(os.path.abspath(site_dir).encode("utf-8")).hexdigest()[:16] + ".json",
+        )
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+
+    manifest = {}
+    written = 0
+    for key, value in _redirects.items():
+        path = _stub_path(site_dir, key)
+        content = _render_stub(config, base, value)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        manifest[key] = digest
+        if previous.get(key) == digest and os.path.isfile(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        written += 1
+
+    removed = 0
+    for key, digest in previous.items():
+        if key in manifest:
+            continue
+        path = _stub_path(site_dir, key)
+        try:
+            with open(path, "rb") as f:
+                if hashlib.sha256(f.read()).hexdigest() != digest:
+                    continue  # not our stub any more
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+
+    if manifest_path is None:
+        _state["manifest"] = manifest
+    else:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=0, sort_keys=True)
+    return written, removed
+
+
+def _nginx_quote(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _nginx_map(base):
+    lines = [
+        "# Generated from redirects.json by hooks/redirect_stubs.py; do not edit.",
+        "map $uri $redirect_target {",
+        '    default "";',
+    ]
+    for key, value in sorted(_redirects.items()):
+        target = _nginx_quote(_target_url(base, value))
+        source = base + key
+        lines.append(f"    {_nginx_quote(source)} {target};")
+        if source.endswith("/") and len(source) > 1:
+            lines.append(f"    {_nginx_quote(source + 'index.html')} {target};")
+            lines.append(f"    {_nginx_quote(source.rstrip('/'))} {target};")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_if_changed(path, content):
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
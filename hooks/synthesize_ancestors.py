@@ -5,15 +5,21 @@ and the computed page.ancestors property always returns [], so breadcrumbs
 (navigation.path) never render.
 
 This hook:
-  1. Walks the nav tree once (on_nav) to map each directory path to the ordered
-     list of ancestor Section objects for pages inside it (root → leaf order).
+  1. Uses the shared nav index (_nav_index.py, built once per nav in on_nav)
+     to map each directory path to the ordered list of ancestor Section
+     objects for pages inside it (root → leaf order).
   2. For each orphan page (page.parent is None), walks up the file path to find
      the deepest matching directory in the map, then fills any intermediate
-     directory levels with synthetic breadcrumb items.
+     directory levels with synthetic breadcrumb items. Each directory's chain
+     is built once per build, so every orphan page in a directory shares the
+     same parent object and each .nav.yml title is looked up once.
 
 Intermediate directories (not in the nav) use a title from the directory's
 .nav.yml ``title:`` field if present, otherwise fall back to a formatted
-version of the directory name (e.g. "pr-reviews" → "PR Reviews").
+version of the directory name (e.g. "pr-reviews" → "PR Reviews"). The
+.nav.yml files are read through the shared graph in _nav_graph.py, and each
+orphan page records the ones its breadcrumb titles came from in _page_deps.py,
+so dirty rebuilds re-render it when a title changes (see page_dependencies).
 
 Synthetic section objects carry a pre-built ``ancestors`` attribute (leaf →
 root order) so that the computed ``page.ancestors`` property resolves
@@ -23,28 +29,26 @@ correctly without requiring a setter.
 import os
 from types import SimpleNamespace
 
-import yaml
-from mkdocs.structure.nav import Section
-from mkdocs.structure.pages import Page
+import _nav_graph
+import _nav_index
+import _page_deps
 
-# Maps normalised relative directory paths to their ancestor Section objects
-# in root-to-leaf order, e.g. "code-reviews/pr-reviews" → [Code Reviews, PR Reviews].
-_dir_ancestors: dict[str, list] = {}
+# Maps normalised relative directory paths to the leaf→root breadcrumb chain of
+# a page in that directory, e.g. "code-reviews/pr-reviews" → [PR Reviews
+# (synthetic), Code Reviews], or to None when no nav-tracked directory contains
+# it. Seeded with the nav-tracked directories in on_nav and extended one
+# directory at a time as orphan pages ask for them.
+_chains: dict[str, list] = {}
 
 
-def on_nav(nav, *, config, **kwargs):
-    global _dir_ancestors
-    _dir_ancestors = {}
-    _walk(nav.items, [])
+def on_pre_build(config, **kwargs):
+    _nav_graph.graph.begin_build()
+
 
-def _walk(items, ancestors):
-    for item in items:
-        if isinstance(item, Section):
-            _walk(item.children, ancestors + [item])
-        elif isinstance(item, Page):
-            d = os.path.normpath(os.path.dirname(item.file.src_path))
-            if d not in _dir_ancestors:
-                _dir_ancestors[d] = list(ancestors)
+def on_nav(nav, *, config, **kwargs):
+    global _chains
+    dir_ancestors = _nav_index.index_for(nav).dir_ancestors
+    _chains = {d: list(reversed(base)) for d, base in dir_ancestors.items()}
 
 
 def on_page_context(context, page, *, config, nav, **kwargs):
@@ -56,64 +60,66 @@ def on_page_context(context, page, *, config, nav, **kwargs):
     new_parent = _make_parent(page_dir, config["docs_dir"])
     if new_parent is not None:
         page.parent = new_parent
+        for item in [new_parent, *new_parent.ancestors]:
+            nav_file = getattr(item, "nav_file", None)
+            if nav_file is not None:
+                _page_deps.graph.record(page.file.abs_src_path, nav_file)
 
     return context
 
 
 def _make_parent(page_dir, docs_dir):
-    """Return a parent object (real Section or synthetic) for an orphan page."""
+    """Return a parent object (real Section or synthetic) for an orphan page.
+
+    Orphan pages in the same directory share the same parent object.
+    """
     if page_dir == ".":
         return None
+    chain = _chain(page_dir, docs_dir)
+    return chain[0] if chain else None
 
-    parts = page_dir.split(os.sep)
-
-    # Walk up the directory tree to find the deepest nav-tracked directory.
-    for i in range(len(parts), 0, -1):
-        candidate = os.sep.join(parts[:i])
-        if candidate not in _dir_ancestors:
-            continue
-
-        base = _dir_ancestors[candidate]  # root-to-leaf list of real Sections
-
-        if i == len(parts):
-            # The page's directory is directly in the nav — use the deepest
-            # real Section as the parent.
-            return base[-1] if base else None
-
-        # There are intermediate directories between the nav boundary and the
-        # page.  Build synthetic sections for each level, innermost first.
-        #
-        # page.ancestors is computed as [self.parent, *self.parent.ancestors].
-        # Synthetic objects store a pre-built ``ancestors`` attribute (leaf→root)
-        # so that chain resolves without needing StructureItem machinery.
-        #
-        # Example: page at code-reviews/pr-reviews/github.md
-        #   base = [Code Reviews Section]   (root→leaf, 1 entry)
-        #   intermediate level: "pr-reviews" → "PR Reviews"
-        #   synthetic.ancestors = [Code Reviews]  (leaf→root reversed from base)
-        #   page.parent = synthetic
-        #   page.ancestors = [synthetic, Code Reviews]
-        #   template reverses → [Code Reviews, PR Reviews] → page title  ✓
-
-        current_ancestors = list(reversed(base))  # leaf→root for .ancestors attr
-        current_section = None
-
-        for j in range(i, len(parts)):
-            rel_dir = os.sep.join(parts[: j + 1])
-            title = _dir_title(rel_dir, parts[j], docs_dir)
-            synthetic = SimpleNamespace(
-                title=title,
-                url=None,
-                children=None,
-                # Pre-built leaf→root ancestors list consumed by page.ancestors.
-                ancestors=current_ancestors,
-            )
-            current_section = synthetic
-            current_ancestors = [synthetic] + current_ancestors
-
-        return current_section
-
-    return None
+
+def _chain(rel_dir, docs_dir):
+    """Return the leaf→root breadcrumb chain for pages in ``rel_dir``, or None.
+
+    A nav-tracked directory uses its real Sections. Any other directory gets a
+    synthetic section on top of its parent directory's chain, so intermediate
+    levels between the nav boundary and the page are filled in.
+
+    page.ancestors is computed as [self.parent, *self.parent.ancestors].
+    Synthetic objects store a pre-built ``ancestors`` attribute (leaf→root)
+    so that chain resolves without needing StructureItem machinery.
+
+    Example: page at code-reviews/pr-reviews/github.md
+      chain("code-reviews") = [Code Reviews Section]   (nav-tracked)
+      chain("code-reviews/pr-reviews"):
+        synthetic "PR Reviews" with .ancestors = [Code Reviews]
+        → [synthetic, Code Reviews]
+      page.parent = synthetic
+      page.ancestors = [synthetic, Code Reviews]
+      template reverses → [Code Reviews, PR Reviews] → page title  ✓
+    """
+    if rel_dir in _chains:
+        return _chains[rel_dir]
+
+    parent_dir, dir_name = os.path.split(rel_dir)
+    parent_chain = _chain(parent_dir, docs_dir) if parent_dir else None
+    if parent_chain is None:
+        chain = None
+    else:
+        synthetic = SimpleNamespace(
+            title=_dir_title(rel_dir, dir_name, docs_dir),
+            url=None,
+            children=None,
+            # Pre-built leaf→root ancestors list consumed by page.ancestors.
+            ancestors=parent_chain,
+            # Where the title may come from, recorded as a page dependency.
+            nav_file=os.path.join(docs_dir, rel_dir, _nav_graph.NAV_FILE),
+        )
+        chain = [synthetic] + parent_chain
+
+    _chains[rel_dir] = chain
+    return chain
 
 
 def _dir_title(rel_dir, dir_name, docs_dir):
@@ -122,15 +128,9 @@ def _dir_title(rel_dir, dir_name, docs_dir):
     Checks for a ``title:`` key in the directory's ``.nav.yml`` first;
     falls back to formatting the directory name.
     """
-    nav_yml = os.path.join(docs_dir, rel_dir, ".nav.yml")
-    if os.path.exists(nav_yml):
-        try:
-            with open(nav_yml, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            if isinstance(data, dict) and isinstance(data.get("title"), str):
-                return data["title"]
-        except (OSError, yaml.YAMLError):
-            pass
+    title = _nav_graph.graph.title(os.path.join(docs_dir, rel_dir))
+    if title is not None:
+        return title
     return _format_name(dir_name)
 
 
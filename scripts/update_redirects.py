@@ -15,27 +15,190 @@
 #     new path.                                                                     #
 #   - A new redirect will be added with the old file path as `key` and the new path #
 #     as `value`.                                                                   #
+#   - An existing redirect whose `key` is the new path is dropped, since a page     #
+#     lives there again.                                                            #
+#                                                                                   #
+# Redirects are never left pointing at another redirect: chains (A → B, B → C) are  #
+# collapsed to their final target (A → C), and a cycle in `redirects.json` stops    #
+# the script with an error.                                                         #
 #                                                                                   #
 # To use the script, simply run:                                                    #
 #   python scripts/update_redirects.py <PR_NUMBER> <OWNER> <REPO>                   #
 #                                                                                   #
+# Or, without a PR number or network access, read the changes from the local       #
+# `polkadot-docs` clone (rename detection via `git diff --name-status -M`):         #
+#   python scripts/update_redirects.py --git-diff origin/main..HEAD                 #
+#   python scripts/update_redirects.py --staged        # e.g. from pre-commit       #
+# The clone is expected at `polkadot-docs/` next to `redirects.json`; pass          #
+# `--repo PATH` to diff a clone elsewhere.                                          #
+#                                                                                   #
+# For a large restructure, apply several PRs (comma-separated, in order) or a       #
+# rename map in one pass, with `redirects.json` loaded and saved once:              #
+#   python scripts/update_redirects.py 41,42,45 polkadot-developers polkadot-docs   #
+#   python scripts/update_redirects.py --rename-map moves.csv                       #
+# A rename map is a CSV with `old,new` rows (an empty `new` marks a removal; an     #
+# optional `old,new` header row is skipped), or JSON: an {"old": "new"} object or   #
+# a list of [old, new] pairs, with null for removals. Paths are file paths, as in   #
+# a PR.                                                                             #
+#                                                                                   #
 # Command-line arguments:                                                           #
 #   - `PR_NUMBER`: Pull request number to analyze                                   #
 #   - `OWNER`: GitHub repository owner                                              #
 #   - `REPO`: GitHub repository name                                                #
+#   - `--repo PATH`: docs clone read by `--git-diff`/`--staged`                     #
+#                                                                                   #
+# `redirects.json` is always the one in this repository's root, whatever the        #
+# current directory.                                                                #
 #                                                                                   #
 # Example usage:                                                                    #
 #   python scripts/update_redirects.py 42 polkadot-developers polkadot-docs         #
+#                                                                                   #
+# Environment variables:                                                            #
+#   - `GITHUB_TOKEN`: optional token, raises the API rate limit                     #
+#   - `GITHUB_API_URL`: API base URL (default https://api.github.com), e.g. a       #
+#     local stub server for testing                                                 #
+#                                                                                   #
+# PR files are fetched over one pooled session: the first page reports the page    #
+# count in its `Link` header and the remaining pages are fetched concurrently.      #
+# Responses are cached by ETag under `.cache/update-redirects/`, so re-running for  #
+# the same PR only costs conditional requests, which do not count against the      #
+# rate limit. Rate-limited requests are retried after the reset time.              #
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - #
 
 
+import argparse
+import csv
+import hashlib
 import json
+import os
+import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
+from urllib.parse import parse_qs, urlparse
 
-REDIRECTS_FILE = "redirects.json"
+ROOT_DIR = Path(__file__).resolve().parent.parent
+REDIRECTS_FILE = ROOT_DIR / "redirects.json"
+DOCS_REPO = ROOT_DIR / "polkadot-docs"
 IGNORED_FOLDERS = {"images", "js", "scripts", "run"}
+TODO_VALUE = "TODO: UPDATE_ME"
+
+DEFAULT_API_URL = "https://api.github.com"
+CACHE_DIR = ROOT_DIR / ".cache" / "update-redirects"
+PER_PAGE = 100
+FETCH_WORKERS = 8
+MAX_RETRIES = 5
+MAX_BACKOFF = 60
+
+
+class RedirectCycleError(ValueError):
+    """Raised when following redirects from a key leads back to itself."""
+
+
+class RedirectStore:
+    """
+    Indexed view over the `data` list of `redirects.json`.
+
+    Keeps a key → redirect index and a reverse value → keys index, so adding a
+    redirect or retargeting every redirect that points at a path costs time
+    proportional to the redirects involved, not to the whole file. If the file
+    holds the same key twice, the first entry wins.
+    """
+
+    def __init__(self, entries):
+        self._by_key = {}
+        self._by_value = {}
+        for redirect in entries:
+            if redirect["key"] not in self._by_key:
+                self._by_key[redirect["key"]] = redirect
+                self._index_value(redirect["key"], redirect["value"])
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def __contains__(self, key):
+        return key in self._by_key
+
+    def entries(self):
+        """Return the redirects as a list of {key, value} dicts."""
+        return list(self._by_key.values())
+
+    def add(self, key, value):
+        """
+        Add or update a redirect:
+        - If the exact key/value exists, skip.
+        - If the key exists but value differs, update value.
+        - If key does not exist, add new entry.
+        """
+        redirect = self._by_key.get(key)
+        if redirect is not None:
+            if redirect["value"] == value:
+                return "skipped"  # exact pair already exists
+            self._set_value(redirect, value)  # update to new value
+            return "updated"
+        self._by_key[key] = {"key": key, "value": value}
+        self._index_value(key, value)
+        return "added"
+
+    def remove(self, key):
+        """Drop the redirect for `key`; returns True if there was one."""
+        redirect = self._by_key.pop(key, None)
+        if redirect is None:
+            return False
+        self._unindex_value(key, redirect["value"])
+        return True
+
+    def retarget(self, old_value, new_value):
+        """
+        Point every redirect whose value is `old_value` at `new_value`.
+
+        A redirect that would end up pointing at its own key is dropped.
+        Returns the number of redirects changed.
+        """
+        keys = list(self._by_value.get(old_value, ()))
+        for key in keys:
+            if key == new_value:
+                self.remove(key)
+            else:
+                self._set_value(self._by_key[key], new_value)
+        return len(keys)
+
+    def resolve(self, value):
+        """Follow `value` through existing redirects to its final target."""
+        seen = []
+        while value in self._by_key:
+            if value in seen:
+                chain = " → ".join(seen[seen.index(value):] + [value])
+                raise RedirectCycleError(f"Redirect cycle: {chain}")
+            seen.append(value)
+            value = self._by_key[value]["value"]
+        return value
+
+    def flatten(self):
+        """Collapse every chain to its final target; returns the number changed."""
+        changed = 0
+        for redirect in list(self._by_key.values()):
+            target = self.resolve(redirect["value"])
+            if target != redirect["value"]:
+                self._set_value(redirect, target)
+                changed += 1
+        return changed
+
+    def _set_value(self, redirect, value):
+        self._unindex_value(redirect["key"], redirect["value"])
+        redirect["value"] = value
+        self._index_value(redirect["key"], value)
+
+    def _index_value(self, key, value):
+        self._by_value.setdefault(value, {})[key] = None
+
+    def _unindex_value(self, key, value):
+        keys = self._by_value.get(value)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._by_value[value]
 
 
 def is_ignored(filepath: str) -> bool:
@@ -72,50 +235,173 @@ def save_redirects(data):
         json.dump(data, f, indent=2)
 
 
-def fetch_pr_files(owner: str, repo: str, pr_number: str):
-    url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files"
-    files = []
-    page = 1
+def make_session(token=None):
+    """Return a requests session with a connection pool sized for FETCH_WORKERS."""
+    # Imported here so the offline git modes don't pay for loading requests.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=FETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept"] = "application/vnd.github+json"
+    token = token or os.environ.get("GITHUB_TOKEN")
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
 
-    while True:
-        resp = requests.get(url, params={"page": page, "per_page": 100})
-        resp.raise_for_status()
-        data = resp.json()
-        if not data:
+def _cache_path(url: str, params: dict) -> Path:
+    key = json.dumps([url, sorted(params.items())])
+    return CACHE_DIR / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_cache(path: Path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path: Path, entry: dict):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache is only an optimisation
+
+
+def _backoff_delay(resp, attempt: int):
+    """Return seconds to wait before retrying `resp`, or None if it is final."""
+    rate_limited = resp.status_code == 429 or (
+        resp.status_code == 403 and resp.headers.get("X-RateLimit-Remaining") == "0"
+    )
+    if not rate_limited and resp.status_code not in {502, 503, 504}:
+        return None
+    # The server says when to come back; retrying earlier only fails again,
+    # so these waits are not capped.
+    if "Retry-After" in resp.headers:
+        return max(float(resp.headers["Retry-After"]), 1)
+    if resp.headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in resp.headers:
+        # The reset time has one-second resolution; wait until it has passed.
+        return max(float(resp.headers["X-RateLimit-Reset"]) - time.time() + 1, 1)
+    return min(2 ** attempt, MAX_BACKOFF)
+
+
+def _get(session, url: str, params: dict):
+    """
+    GET `url` and return (json body, links), answering from the ETag cache on 304.
+
+    Rate-limited and transient gateway responses are retried up to MAX_RETRIES
+    times, waiting for `Retry-After` or the rate-limit reset time.
+    """
+    cache_path = _cache_path(url, params)
+    cached = _read_cache(cache_path)
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+    for attempt in range(MAX_RETRIES + 1):
+        resp = session.get(url, params=params, headers=headers)
+        delay = _backoff_delay(resp, attempt)
+        if delay is None or attempt == MAX_RETRIES:
             break
-        files.extend(data)
-        page += 1
+        print(f"⏳ GitHub API returned {resp.status_code}, retrying in {delay:.0f}s")
+        time.sleep(delay)
+
+    if resp.status_code == 304 and cached:
+        return cached["body"], cached["links"]
+    resp.raise_for_status()
+
+    body = resp.json()
+    links = {rel: link["url"] for rel, link in resp.links.items()}
+    if resp.headers.get("ETag"):
+        _write_cache(cache_path, {"etag": resp.headers["ETag"], "body": body, "links": links})
+    return body, links
+
+
+def _last_page(links: dict) -> int:
+    if "last" not in links:
+        return 1
+    query = parse_qs(urlparse(links["last"]).query)
+    return int(query.get("page", ["1"])[0])
+
+
+def fetch_pr_files(owner: str, repo: str, pr_number: str, session=None, api_url=None):
+    api_url = (api_url or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL).rstrip("/")
+    url = f"{api_url}/repos/{owner}/{repo}/pulls/{pr_number}/files"
+    session = session or make_session()
+
+    first, links = _get(session, url, {"page": 1, "per_page": PER_PAGE})
+    files = list(first)
+    last_page = _last_page(links)
+
+    if last_page > 1:
+        pages = range(2, last_page + 1)
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(pages))) as pool:
+            results = pool.map(lambda page: _get(session, url, {"page": page, "per_page": PER_PAGE}), pages)
+            for data, _ in results:
+                files.extend(data)
+    elif "next" in links:
+        # No page count advertised; follow the `next` links one by one.
+        page = 1
+        while "next" in links:
+            page += 1
+            data, links = _get(session, url, {"page": page, "per_page": PER_PAGE})
+            files.extend(data)
     return files
 
 
-def add_redirect(existing, key, value):
-    """
-    Add or update a redirect:
-    - If the exact key/value exists, skip.
-    - If the key exists but value differs, update value.
-    - If key does not exist, add new entry.
+def fetch_git_changes(rev_range=None, staged=False, repo=DOCS_REPO):
     """
-    for redirect in existing:
-        if redirect["key"] == key:
-            if redirect["value"] != value:
-                redirect["value"] = value  # update to new value
-                return "updated"
-            return "skipped"  # exact pair already exists
-    existing.append({"key": key, "value": value})
-    return "added"
+    Return removed/renamed files from the docs clone at `repo`, in the same
+    format as `fetch_pr_files`, using `git diff --name-status -M`.
 
+    `rev_range` is anything `git diff` accepts, e.g. "origin/main..HEAD";
+    `staged` compares the index against HEAD instead.
+    """
+    cmd = ["git", "-C", str(repo), "diff", "--name-status", "-M", "-z"]
+    cmd += ["--cached"] if staged else [rev_range]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+
+    changes = []
+    fields = iter(out.split("\0"))
+    for status in fields:
+        if not status:
+            continue
+        if status.startswith(("R", "C")):
+            old_path, new_path = next(fields), next(fields)
+            if status[0] == "R":
+                changes.append({"status": "renamed", "previous_filename": old_path, "filename": new_path})
+        else:
+            path = next(fields)
+            if status == "D":
+                changes.append({"status": "removed", "filename": path})
+    return changes
+
+
+def update_redirects(changes, source: str):
+    """
+    Apply a list of file changes to `redirects.json`.
 
-def process_pr(owner: str, repo: str, pr_number: str):
-    pr_files = fetch_pr_files(owner, repo, pr_number)
+    Each change is a dict in the GitHub PR files format: `status` ("removed",
+    "renamed", ...), `filename` and, for renames, `previous_filename`.
+    """
     redirects = load_redirects()
-    existing = redirects["data"]
+    original_count = len(redirects["data"])
+    store = RedirectStore(redirects["data"])
 
-    original_count = len(existing)
-    modified_count = 0
+    # Flatten first: every change below keeps the store chain-free, so a batch
+    # gives the same result as applying its changes one run at a time.
+    modified_count = store.flatten()
+    removed_count = 0
     added_count = 0
     added_redirects = []
 
-    for f in pr_files:
+    for f in changes:
         status = f.get("status")
         old_path = f.get("previous_filename")
         new_path = f.get("filename")
@@ -131,13 +417,10 @@ def process_pr(owner: str, repo: str, pr_number: str):
 
         if status == "removed":
             formatted = format_path(new_path)
-            for redirect in existing:
-                if redirect["value"] == formatted:
-                    redirect["value"] = "TODO: UPDATE_ME"
-                    modified_count += 1
-            result = add_redirect(existing, formatted, "TODO: UPDATE_ME")
+            modified_count += store.retarget(formatted, TODO_VALUE)
+            result = store.add(formatted, TODO_VALUE)
             if result == "added":
-                added_redirects.append({"key": formatted, "value": "TODO: UPDATE_ME"})
+                added_redirects.append({"key": formatted, "value": TODO_VALUE})
                 added_count += 1
             elif result == "updated":
                 modified_count += 1
@@ -146,25 +429,29 @@ def process_pr(owner: str, repo: str, pr_number: str):
             # Apply format_path to both old and new paths, handles index.md as well
             formatted_old = format_path(old_path)
             formatted_new = format_path(new_path)
-            for redirect in existing:
-                if redirect["value"] == formatted_old:
-                    redirect["value"] = formatted_new
-                    modified_count += 1
-            result = add_redirect(existing, formatted_old, formatted_new)
+            if formatted_old == formatted_new:
+                continue  # e.g. page.md → page/index.md keeps its URL
+            # The new path is a live page again, so it can't also be a redirect.
+            if store.remove(formatted_new):
+                removed_count += 1
+            modified_count += store.retarget(formatted_old, formatted_new)
+            result = store.add(formatted_old, formatted_new)
             if result == "added":
                 added_redirects.append({"key": formatted_old, "value": formatted_new})
                 added_count += 1
             elif result == "updated":
                 modified_count += 1
 
+    redirects["data"] = store.entries()
     save_redirects(redirects)
 
-    print(f"✅ Redirects updated for PR #{pr_number} in repo {owner}/{repo}")
+    print(f"✅ Redirects updated for {source}")
 
     print(f"\n🔢 Stats:")
     print(f"Original redirects: {original_count}")
     print(f"Redirects modified: {modified_count}")
     print(f"Redirects added: {added_count}")
+    print(f"Redirects removed: {removed_count}")
     print(f"Total redirects now: {len(redirects['data'])}")
 
     if added_count > 0:
@@ -173,13 +460,111 @@ def process_pr(owner: str, repo: str, pr_number: str):
             print(f"key: {r['key']}, value: {r['value']}")
 
 
-if __name__ == "__main__":
-    if len(sys.argv) != 4:
-        print("Usage: python scripts/update_redirects.py <PR_NUMBER> <OWNER> <REPO>")
-        sys.exit(1)
+def load_rename_map(path: str):
+    """Return the changes described by a CSV or JSON rename map (see header)."""
+    if path.endswith(".json"):
+        with open(path, "r") as f:
+            data = json.load(f)
+        pairs = data.items() if isinstance(data, dict) else data
+    else:
+        with open(path, "r", newline="") as f:
+            # `old, new` rows are common in hand-written maps; the spaces are not part of the paths.
+            pairs = [[c.strip() for c in row] for row in csv.reader(f)]
+        pairs = [row for row in pairs if any(row)]
+        if pairs and pairs[0][:2] == ["old", "new"]:
+            pairs = pairs[1:]
+
+    changes = []
+    for pair in pairs:
+        old_path, new_path = (list(pair) + [None])[:2]
+        if not old_path:
+            continue
+        if new_path:
+            changes.append({"status": "renamed", "previous_filename": old_path, "filename": new_path})
+        else:
+            changes.append({"status": "removed", "filename": old_path})
+    return changes
 
-    pr_number = sys.argv[1]
-    owner = sys.argv[2]
-    repo = sys.argv[3]
 
-    process_pr(owner, repo, pr_number)
\ No newline at end of file
+def process_pr(owner: str, repo: str, pr_number: str):
+    """Apply one PR, or several comma-separated PR numbers in order in one pass."""
+    pr_numbers = [n.strip() for n in pr_number.split(",") if n.strip()]
+    session = make_session()
+    changes = []
+    for number in pr_numbers:
+        changes.extend(fetch_pr_files(owner, repo, number, session=session))
+    label = "PR" if len(pr_numbers) == 1 else "PRs"
+    update_redirects(changes, f"{label} #{', #'.join(pr_numbers)} in repo {owner}/{repo}")
+
+
+def process_rename_map(path: str):
+    update_redirects(load_rename_map(path), f"rename map {path}")
+
+
+def process_git_diff(rev_range=None, staged=False, repo=DOCS_REPO):
+    changes = fetch_git_changes(rev_range, staged, repo)
+    source = f"staged changes in {repo}" if staged else f"git diff {rev_range} in {repo}"
+    update_redirects(changes, source)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Update redirects.json for files removed or renamed in a pull request or git diff.",
+    )
+    parser.add_argument(
+        "pr_number",
+        nargs="?",
+        metavar="PR_NUMBER",
+        help="Pull request number to analyze, or several separated by commas",
+    )
+    parser.add_argument("owner", nargs="?", metavar="OWNER", help="GitHub repository owner")
+    parser.add_argument("repo", nargs="?", metavar="REPO", help="GitHub repository name")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--git-diff",
+        metavar="BASE..HEAD",
+        help="Read changes from the local repository instead of the GitHub API",
+    )
+    source.add_argument(
+        "--staged",
+        action="store_true",
+        help="Read changes staged in the local repository (for pre-commit)",
+    )
+    source.add_argument(
+        "--rename-map",
+        metavar="FILE",
+        help="Apply the moves listed in a CSV or JSON rename map",
+    )
+    parser.add_argument(
+        "--repo",
+        dest="docs_repo",
+        metavar="PATH",
+        type=Path,
+        help="Docs clone to read --git-diff/--staged changes from (default: polkadot-docs next to redirects.json)",
+    )
+    args = parser.parse_args(argv)
+
+    offline = args.git_diff is not None or args.staged or args.rename_map is not None
+    positionals = [args.pr_number, args.owner, args.repo]
+    if offline and any(positionals):
+        parser.error("PR_NUMBER OWNER REPO cannot be combined with --git-diff, --staged or --rename-map")
+    if not offline and not all(positionals):
+        parser.error("PR_NUMBER, OWNER and REPO are required unless --git-diff, --staged or --rename-map is given")
+    if args.docs_repo is not None and args.git_diff is None and not args.staged:
+        parser.error("--repo only applies to --git-diff and --staged")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        if args.rename_map is not None:
+            process_rename_map(args.rename_map)
+        elif args.git_diff is not None or args.staged:
+            process_git_diff(args.git_diff, args.staged, args.docs_repo or DOCS_REPO)
+        else:
+            process_pr(args.owner, args.repo, args.pr_number)
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"❌ git diff failed: {e.stderr.strip()}")
+    except RedirectCycleError as e:
+        sys.exit(f"❌ {REDIRECTS_FILE.name} was not changed. {e}; fix these entries by hand.")
@@ -0,0 +1,23 @@
+import importlib.util
+import os
+
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+
+
+@pytest.fixture
+def update_redirects(tmp_path, monkeypatch):
+    """scripts/update_redirects.py, freshly loaded, writing only under ``tmp_path``."""
+    spec = importlib.util.spec_from_file_location(
+        "update_redirects_under_test", os.path.join(SCRIPTS_DIR, "update_redirects.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    redirects_file = tmp_path / "redirects.json"
+    redirects_file.write_text('{"data": []}\n', encoding="utf-8")
+    monkeypatch.setattr(module, "REDIRECTS_FILE", redirects_file)
+    monkeypatch.setattr(module, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    return module
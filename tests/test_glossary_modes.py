@@ -0,0 +1,144 @@
+"""glossary_abbreviations: deferred mode must write the same site as inline mode.
+
+Each case builds a small site twice through MkDocs itself (so every plugin in
+the chain runs, in its real order), once per mode, and compares every file.
+The search index is the one exception: the search plugin reads page content
+before deferred annotation, so only the words it indexes are compared.
+"""
+
+import importlib.util
+import json
+import os
+import re
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+HOOK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "hooks", "glossary_abbreviations.py")
+
+GLOSSARY = """\
+---
+title: Glossary
+---
+# Glossary
+
+## Runtime
+
+The state transition function of a chain.
+
+## Cross-Consensus Messaging (XCM)
+
+A format for messages between chains.
+
+## Pallet
+
+Module
+"""
+
+PAGE = """\
+# Guide
+
+The Runtime isn&rsquo;t &quot;the node&quot;; chains talk over XCM.
+Each Pallet adds one feature.
+
+Another  paragraph   about the runtime &amp; Cross-Consensus Messaging.
+
+```text
+Runtime in code is left alone
+```
+"""
+
+PLUGIN_CHAINS = {
+    "search": ["search"],
+    "search+minify": ["search", {"minify": {"minify_html": True}}],
+}
+
+
+def _site(root, mode, plugins):
+    docs = root / "docs"
+    (docs / "reference").mkdir(parents=True)
+    (docs / "index.md").write_text(PAGE, encoding="utf-8")
+    (docs / "guide.md").write_text(PAGE.replace("Guide", "Second guide"), encoding="utf-8")
+    (docs / "reference" / "glossary.md").write_text(GLOSSARY, encoding="utf-8")
+    plugin_lines = "\n".join(
+        f"  - {p}" if isinstance(p, str) else textwrap.indent(_yaml_plugin(p), "  ")
+        for p in plugins
+    )
+    (root / "mkdocs.yml").write_text(
+        "site_name: Modes\n"
+        f"plugins:\n{plugin_lines}\n"
+        f"hooks:\n  - {HOOK}\n"
+        "extra:\n"
+        "  glossary_tooltips:\n"
+        f"    mode: {mode}\n"
+        "    workers: 2\n"
+        "    cache: false\n",
+        encoding="utf-8",
+    )
+    return root
+
+
+def _yaml_plugin(plugin):
+    (name, options), = plugin.items()
+    lines = [f"- {name}:"] + [f"    {key}: {str(value).lower()}" for key, value in options.items()]
+    return "\n".join(lines)
+
+
+def _build(root):
+    cwd = os.getcwd()
+    os.chdir(root)  # the hook resolves .cache/ next to mkdocs.yml
+    try:
+        build(load_config(config_file=str(root / "mkdocs.yml")))
+    finally:
+        os.chdir(cwd)
+    site = root / "site"
+    return {
+        str(path.relative_to(site)): path.read_bytes()
+        for path in sorted(site.rglob("*"))
+        if path.is_file() and path.name not in ("sitemap.xml", "sitemap.xml.gz")
+    }
+
+
+@pytest.mark.parametrize("chain", sorted(PLUGIN_CHAINS))
+def test_deferred_matches_inline(tmp_path, monkeypatch, chain):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")  # same build date in both sites
+    plugins = PLUGIN_CHAINS[chain]
+    if any(isinstance(p, dict) and "minify" in p for p in plugins):
+        pytest.importorskip("mkdocs_minify_plugin.plugin")
+
+    inline = _build(_site(tmp_path / "inline", "inline", plugins))
+    deferred = _build(_site(tmp_path / "deferred", "deferred", plugins))
+
+    assert b"<abbr" in inline["index.html"]
+    assert b"isn&rsquo;t &quot;the node&quot;" in inline["index.html"]
+    assert inline.keys() == deferred.keys()
+    for name in inline:
+        if name == os.path.join("search", "search_index.json"):
+            assert _indexed_words(deferred[name]) == _indexed_words(inline[name])
+        else:
+            assert deferred[name] == inline[name], name
+
+
+def _indexed_words(data):
+    """Per search entry: location, title and the words lunr would index."""
+    return [
+        (doc["location"], doc["title"], [w for w in (re.sub(r"^\W+|\W+$", "", t) for t in doc["text"].split()) if w])
+        for doc in json.loads(data)["docs"]
+    ]
+
+
+@pytest.mark.parametrize("minify_html", [True, False])
+def test_deferred_refused_with_minify_html(monkeypatch, minify_html):
+    monkeypatch.syspath_prepend(os.path.dirname(HOOK))
+    spec = importlib.util.spec_from_file_location("glossary_hook_under_test", HOOK)
+    hook = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hook)
+
+    config = {
+        "extra": {"glossary_tooltips": {"mode": "deferred"}},
+        "plugins": {"minify": SimpleNamespace(config={"minify_html": minify_html})},
+    }
+    assert hook._use_deferred(config) is not minify_html
@@ -0,0 +1,137 @@
+"""glossary_abbreviations: the streaming rewriter must annotate what BeautifulSoup did.
+
+``reference_annotate`` is the BeautifulSoup implementation the streaming pass
+replaced, kept here as the oracle. BeautifulSoup re-serializes the whole page
+(entities, attribute quoting, ...) while the streaming pass copies untouched
+bytes verbatim, so both outputs are compared after a BeautifulSoup round trip.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+bs4 = pytest.importorskip("bs4")
+
+HOOKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "hooks")
+
+TERMS = {
+    "Cross-Consensus Messaging": "A format for messages between chains.",
+    "Relay Chain": "The central chain of the network.",
+    "Runtime": "The state transition function of a chain.",
+    "Pallet": "Module",
+    "R&D": "Research & \"development\" <work>.",
+    "XCM": "A format for messages between chains.",
+}
+
+CASES = {
+    "plain": "<p>The Runtime sends XCM to the Relay Chain.</p>",
+    "longest match": "<p>Cross-Consensus Messaging and Relay Chains and Relay Chain-based.</p>",
+    "nested inline tags": (
+        '<p>The <em>Runtime and <span class="x">XCM</span></em> and '
+        "<mark>nested <sup>Pallet</sup></mark> text.</p>"
+    ),
+    "skipped tags": (
+        '<p><a href="/runtime/">Runtime</a> <code>XCM</code> <strong>Pallet</strong> '
+        "<b>Runtime</b> <kbd>XCM</kbd> <abbr>Pallet</abbr> <button>XCM</button> "
+        "<em><a href=\"#\">deep <span>Runtime</span></a></em> but Runtime here.</p>"
+        "<pre><code>Runtime</code></pre>"
+    ),
+    "outside paragraphs": (
+        "<h2>Runtime</h2><ul><li>XCM</li><li><p>Pallet in a list paragraph</p></li></ul>"
+        "<table><tr><td>Runtime</td></tr></table><div>Relay Chain</div>"
+    ),
+    "grid cards": (
+        '<div class="grid cards"><ul><li><p>Runtime card</p>'
+        '<div><p>Nested XCM card</p></div></li></ul></div>'
+        '<div class="grid"><p>Runtime in a plain grid</p></div>'
+        '<div class="cards"><p>XCM in plain cards</p></div>'
+        "<p>Runtime after the grid</p>"
+    ),
+    "entities": (
+        "<p>Runtime&amp;XCM, &lt;Runtime&gt;, &quot;Pallet&quot; isn&rsquo;t "
+        "R&amp;D&nbsp;XCM &#8220;Relay Chain&#8221; &#x58;CM</p>"
+    ),
+    "attributes and void tags": (
+        '<p title="Runtime"><img alt="XCM" src="x.png">Runtime<br/>XCM'
+        "<input value='Pallet'> Pallet</p>"
+    ),
+    "script and style": (
+        "<p><script>var Runtime = 'XCM';</script>Runtime"
+        "<style>.XCM { color: red }</style> XCM</p>"
+    ),
+    "word boundaries": "<p>Runtimes, XCM-based, pre-Runtime, _XCM, Runtime_ and (Runtime).</p>",
+    "svg": '<p><svg><text>Runtime</text></svg> Runtime</p>',
+}
+
+
+@pytest.fixture(scope="module")
+def hook():
+    spec = importlib.util.spec_from_file_location(
+        "glossary_hook_rewriter_test", os.path.join(HOOKS_DIR, "glossary_abbreviations.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(HOOKS_DIR)
+        spec.loader.exec_module(module)
+    return module
+
+
+def reference_annotate(content, terms, matcher):
+    """The BeautifulSoup implementation that _annotate_html replaced."""
+    soup = bs4.BeautifulSoup(content, "html.parser")
+    for paragraph in soup.find_all("p"):
+        if any(
+            "grid" in parent.get("class", []) and "cards" in parent.get("class", [])
+            for parent in paragraph.parents
+        ):
+            continue
+        for text_node in list(paragraph.find_all(string=True)):
+            if not isinstance(text_node, bs4.NavigableString):
+                continue
+            parent = text_node.parent
+            while parent is not None and parent is not paragraph:
+                if parent.name in {
+                    "a", "abbr", "b", "button", "code", "kbd", "pre", "script", "strong", "style", "svg",
+                }:
+                    break
+                parent = parent.parent
+            else:
+                text = str(text_node)
+                nodes, last_end = [], 0
+                for start, end in matcher.finditer(text):
+                    if start > last_end:
+                        nodes.append(bs4.NavigableString(text[last_end:start]))
+                    abbr = soup.new_tag("abbr", title=terms[text[start:end]])
+                    abbr.string = text[start:end]
+                    nodes.append(abbr)
+                    last_end = end
+                if nodes:
+                    if last_end < len(text):
+                        nodes.append(bs4.NavigableString(text[last_end:]))
+                    text_node.replace_with(*nodes)
+    return str(soup)
+
+
+def _normalize(content):
+    return str(bs4.BeautifulSoup(content, "html.parser"))
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_matches_beautifulsoup(hook, name):
+    matcher = hook.TermMatcher(TERMS)
+    content = CASES[name]
+
+    annotated = hook._annotate_html(content, TERMS, matcher)
+
+    assert _normalize(annotated) == _normalize(reference_annotate(content, TERMS, matcher))
+
+
+def test_untouched_bytes_are_kept(hook):
+    content = CASES["entities"] + "<p class=x title='a&amp;b'>No terms &amp; no changes</p>"
+
+    annotated = hook._annotate_html(content, TERMS, hook.TermMatcher(TERMS))
+
+    assert "<abbr" in annotated
+    assert "isn&rsquo;t" in annotated and "&#8220;" in annotated and "&#x58;CM" in annotated
+    assert annotated.endswith("<p class=x title='a&amp;b'>No terms &amp; no changes</p>")
@@ -0,0 +1,73 @@
+"""update_redirects: applying several PRs in one pass must match applying them one by one."""
+
+import json
+
+import pytest
+
+EXISTING = {
+    "data": [
+        {"key": "/legacy/", "value": "/guides/a/"},
+        {"key": "/older/", "value": "/legacy/"},
+        {"key": "/tools/", "value": "/tools/overview/"},
+    ]
+}
+
+PRS = {
+    "1": [
+        {"status": "renamed", "previous_filename": "guides/a.md", "filename": "guides/b.md"},
+        {"status": "removed", "filename": "tools/overview.md"},
+        {"status": "renamed", "previous_filename": "develop/index.md", "filename": "build/index.md"},
+        {"status": "modified", "filename": "guides/c.md"},
+    ],
+    "2": [
+        {"status": "renamed", "previous_filename": "guides/b.md", "filename": "guides/c.md"},
+        {"status": "renamed", "previous_filename": "build/index.md", "filename": "develop/index.md"},
+        {"status": "renamed", "previous_filename": ".snippets/x.md", "filename": ".snippets/y.md"},
+    ],
+    "3": [
+        {"status": "removed", "filename": "guides/c.md"},
+        {"status": "renamed", "previous_filename": "tools/new.md", "filename": "tools/overview.md"},
+    ],
+}
+
+
+@pytest.fixture
+def fake_github(update_redirects, monkeypatch):
+    monkeypatch.setattr(update_redirects, "make_session", lambda token=None: None)
+    monkeypatch.setattr(
+        update_redirects, "fetch_pr_files",
+        lambda owner, repo, number, session=None, api_url=None: [dict(c) for c in PRS[number]],
+    )
+    return update_redirects
+
+
+def _run(module, pr_batches):
+    module.REDIRECTS_FILE.write_text(json.dumps(EXISTING), encoding="utf-8")
+    for batch in pr_batches:
+        module.process_pr("polkadot-developers", "polkadot-docs", batch)
+    return json.loads(module.REDIRECTS_FILE.read_text(encoding="utf-8"))
+
+
+def test_batch_matches_sequential(fake_github):
+    sequential = _run(fake_github, ["1", "2", "3"])
+    batch = _run(fake_github, ["1,2,3"])
+
+    assert batch == sequential
+    # Sanity check that the PRs exercised chains, removals and restored pages.
+    redirects = {r["key"]: r["value"] for r in batch["data"]}
+    assert redirects["/legacy/"] == redirects["/older/"] == "TODO: UPDATE_ME"
+    assert "/develop/" not in redirects
+    assert "/tools/overview/" not in redirects
+
+
+def test_csv_rename_map_matches_json(update_redirects, tmp_path):
+    csv_map = tmp_path / "moves.csv"
+    csv_map.write_text("old, new\n guides/a.md , guides/b.md\n\ntools/x.md, \n", encoding="utf-8")
+    json_map = tmp_path / "moves.json"
+    json_map.write_text(json.dumps({"guides/a.md": "guides/b.md", "tools/x.md": None}), encoding="utf-8")
+
+    assert update_redirects.load_rename_map(str(csv_map)) == update_redirects.load_rename_map(str(json_map))
+    assert update_redirects.load_rename_map(str(csv_map)) == [
+        {"status": "renamed", "previous_filename": "guides/a.md", "filename": "guides/b.md"},
+        {"status": "removed", "filename": "tools/x.md"},
+    ]
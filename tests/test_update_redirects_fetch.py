@@ -0,0 +1,162 @@
+"""update_redirects: fetching PR files from a local stand-in for the GitHub API.
+
+The stub server answers ``/repos/<owner>/<repo>/pulls/<n>/files`` with pages of
+a fixed file list, paginated through the ``Link`` header and tagged with an
+ETag, and can be told to rate-limit chosen requests first.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+FILES = [
+    {"status": "renamed", "previous_filename": f"old/page-{i}.md", "filename": f"new/page-{i}.md"}
+    for i in range(250)
+]
+
+
+class StubGitHub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, advertise_last=True):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.advertise_last = advertise_last
+        self.requests = []  # (page, status)
+        self.limited = {}  # page → list of (status, headers) to answer first
+        self.lock = threading.Lock()
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        page, per_page = int(query["page"][0]), int(query["per_page"][0])
+        last = -(-len(FILES) // per_page)
+
+        with server.lock:
+            queued = server.limited.get(page)
+            limited = queued.pop(0) if queued else None
+        if limited is not None:
+            status, headers = limited
+            self._respond(page, status, headers)
+            return
+
+        etag = f'"page-{page}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._respond(page, 304, {"ETag": etag})
+            return
+
+        base = f"{server.api_url}{url.path}?per_page={per_page}"
+        links = []
+        if page < last:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+        if server.advertise_last:
+            links.append(f'<{base}&page={last}>; rel="last"')
+        body = json.dumps(FILES[(page - 1) * per_page:page * per_page]).encode("utf-8")
+        headers = {"ETag": etag, "Content-Type": "application/json"}
+        if links:
+            headers["Link"] = ", ".join(links)
+        self._respond(page, 200, headers, body)
+
+    def _respond(self, page, status, headers, body=b""):
+        with self.server.lock:
+            self.server.requests.append((page, status))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**kwargs):
+        server = StubGitHub(**kwargs)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def sleeps(update_redirects, monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    calls = []
+    monkeypatch.setattr(update_redirects.time, "sleep", calls.append)
+    return calls
+
+
+@pytest.mark.parametrize("advertise_last", [True, False], ids=["last", "next-only"])
+def test_follows_link_pagination(update_redirects, stub, advertise_last):
+    server = stub(advertise_last=advertise_last)
+
+    files = update_redirects.fetch_pr_files("o", "r", "7", api_url=server.api_url)
+
+    assert files == FILES
+    assert sorted(server.requests) == [(1, 200), (2, 200), (3, 200)]
+
+
+def test_reuses_cached_pages_on_304(update_redirects, stub):
+    server = stub()
+    first = update_redirects.fetch_pr_files("o", "r", "7", api_url=server.api_url)
+    server.requests.clear()
+
+    second = update_redirects.fetch_pr_files("o", "r", "7", api_url=server.api_url)
+
+    assert second == first == FILES
+    assert sorted(server.requests) == [(1, 304), (2, 304), (3, 304)]
+
+
+def test_retries_after_retry_after(update_redirects, stub, sleeps):
+    server = stub()
+    server.limited[2] = [(429, {"Retry-After": "90"}), (503, {})]
+
+    files = update_redirects.fetch_pr_files("o", "r", "7", api_url=server.api_url)
+
+    assert files == FILES
+    assert [s for p, s in sorted(server.requests) if p == 2] == [200, 429, 503]
+    assert sleeps == [90, 2]  # Retry-After is honoured in full; then backoff
+
+
+def test_waits_for_rate_limit_reset(update_redirects, stub, sleeps):
+    server = stub()
+    reset = time.time() + 300
+    server.limited[1] = [
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(reset))}),
+    ]
+
+    files = update_redirects.fetch_pr_files("o", "r", "7", api_url=server.api_url)
+
+    assert files == FILES
+    assert len(sleeps) == 1
+    assert reset - 1 <= time.time() + sleeps[0] <= reset + 2
+    assert sleeps[0] > update_redirects.MAX_BACKOFF
+
+
+def test_gives_up_after_max_retries(update_redirects, stub, sleeps):
+    server = stub()
+    server.limited[1] = [(502, {})] * (update_redirects.MAX_RETRIES + 1)
+
+    with pytest.raises(Exception, match="502"):
+        update_redirects.fetch_pr_files("o", "r", "7", api_url=server.api_url)
+    assert len(sleeps) == update_redirects.MAX_RETRIES
+    assert max(sleeps) <= update_redirects.MAX_BACKOFF